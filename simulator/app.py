@@ -576,7 +576,11 @@ class CrockpotApp(App):
             ScheduleStep(state=state, duration_seconds=duration)
             for state, duration in self._builder_steps
         ]
-        schedule = Schedule(name="Custom", steps=steps)
+        try:
+            schedule = Schedule(name="Custom", steps=steps)
+        except ValueError as e:
+            self.notify(str(e), severity="error")
+            return
         self.simulator.start_schedule(schedule)
         self._builder_steps = []
 
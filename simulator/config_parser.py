@@ -13,6 +13,8 @@ class ConfigParser:
     def __init__(self, firmware_path: Path):
         self.firmware_path = firmware_path
         self.constants: dict[str, Any] = {}
+        # Parsed values per header: path -> (mtime, constants)
+        self._file_cache: dict[Path, tuple[float, dict[str, Any]]] = {}
         self._load_defaults()
 
     def _load_defaults(self) -> None:
@@ -26,25 +28,41 @@ class ConfigParser:
         }
 
     def parse_all(self) -> dict[str, Any]:
-        """Parse all relevant header files and return constants."""
-        self._load_defaults()
+        """
+        Parse all relevant header files and return constants.
 
-        crockpot_h = self.firmware_path / "main" / "crockpot.h"
-        relay_h = self.firmware_path / "main" / "relay.h"
+        Headers are only re-read when their mtime changes.
+        """
+        self._load_defaults()
 
-        if crockpot_h.exists():
-            self._parse_file(crockpot_h)
-        if relay_h.exists():
-            self._parse_file(relay_h)
+        for filepath in watch_paths(self.firmware_path):
+            self.constants.update(self._parse_cached(filepath))
 
         return self.constants
 
-    def _parse_file(self, filepath: Path) -> None:
+    def _parse_cached(self, filepath: Path) -> dict[str, Any]:
+        """Parse a header file, reusing the last result if its mtime is unchanged."""
+        try:
+            mtime = filepath.stat().st_mtime
+        except OSError:
+            self._file_cache.pop(filepath, None)
+            return {}
+
+        cached = self._file_cache.get(filepath)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        values = self._parse_file(filepath)
+        self._file_cache[filepath] = (mtime, values)
+        return values
+
+    def _parse_file(self, filepath: Path) -> dict[str, Any]:
         """Parse a single header file for #define statements."""
+        values: dict[str, Any] = {}
         try:
             content = filepath.read_text(encoding="utf-8")
         except Exception:
-            return
+            return values
 
         # Match #define NAME VALUE patterns
         # Handles: integers, floats (with f suffix), hex values
@@ -60,7 +78,9 @@ class ConfigParser:
 
             value = self._parse_value(value_str)
             if value is not None:
-                self.constants[name] = value
+                values[name] = value
+
+        return values
 
     def _parse_value(self, value_str: str) -> int | float | None:
         """Parse a C constant value to Python type."""
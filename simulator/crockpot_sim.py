@@ -3,6 +3,7 @@ Core crockpot state machine simulator.
 Mirrors the logic in firmware/main/crockpot.c
 """
 
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -45,6 +46,8 @@ class CrockpotSimulator:
 
     # Maximum consecutive sensor errors before safety shutoff
     MAX_SENSOR_ERRORS = 10
+    # Shortest accepted control interval; lower header values are clamped
+    MIN_CONTROL_INTERVAL_MS = 100
 
     def __init__(
         self,
@@ -56,12 +59,13 @@ class CrockpotSimulator:
         enable_datalog: bool = True,
     ):
         self.safety_temp_f = safety_temp_f
-        self.control_interval_ms = control_interval_ms
+        self.control_interval_ms = max(control_interval_ms, self.MIN_CONTROL_INTERVAL_MS)
         self.on_state_change = on_state_change
         self.on_safety_shutoff = on_safety_shutoff
 
         self._state = CrockpotState.OFF
         self._uptime = 0
+        self._boot_time = time.monotonic()
         self._wifi_connected = True
         self._consecutive_errors = 0
 
@@ -75,9 +79,8 @@ class CrockpotSimulator:
         if enable_schedule:
             from schedule import ScheduleManager
             self._schedule_manager = ScheduleManager(
-                on_state_change=self._schedule_state_change,
                 on_schedule_complete=self._on_schedule_complete,
-                on_step_change=self._on_step_change,
+                on_transition=self._on_schedule_transition,
             )
 
         # Data logger
@@ -121,14 +124,16 @@ class CrockpotSimulator:
         schedule_step_remaining = 0
         schedule_step_progress = 0.0
 
-        if self._schedule_manager and self._schedule_manager.is_active:
+        manager = self._schedule_manager
+        if manager and manager.is_active:
             schedule_active = True
-            if self._schedule_manager.active_schedule:
-                schedule_name = self._schedule_manager.active_schedule.name
-            schedule_step = self._schedule_manager.current_step_index
-            schedule_total_steps = self._schedule_manager.total_steps
-            schedule_step_remaining = self._schedule_manager.step_remaining_seconds
-            schedule_step_progress = self._schedule_manager.get_step_progress()
+            schedule_name = manager.active_schedule.name
+            (
+                schedule_step,
+                schedule_total_steps,
+                schedule_step_remaining,
+                schedule_step_progress,
+            ) = manager.get_step_info()
 
         return CrockpotStatus(
             state=self._state,
@@ -146,18 +151,21 @@ class CrockpotSimulator:
             schedule_step_progress=schedule_step_progress,
         )
 
-    def control_loop(self) -> None:
+    def control_loop(self, dt: float = 1.0) -> None:
         """
-        Main control loop - call once per second.
+        Main control loop - call once per control interval.
         Mirrors crockpot_control_task() from crockpot.c:144-196.
+
+        Args:
+            dt: Seconds since the previous call
         """
         # Update temperature simulation (equivalent to temperature_read())
         temp_state = State(self._state.value)
-        temp = self._temp_sim.update(temp_state, self._relay_main, dt=1.0)
+        temp = self._temp_sim.update(temp_state, self._relay_main, dt=dt)
         sensor_error = self._temp_sim.has_error()
 
-        # Update uptime (crockpot.c:164-165)
-        self._uptime += 1
+        # Update uptime from the boot time, not the tick count (crockpot.c:164-165)
+        self._uptime = int(time.monotonic() - self._boot_time)
 
         # Safety check: high temperature (crockpot.c:171-176)
         # Only check if reading is valid (no sensor error)
@@ -227,8 +235,9 @@ class CrockpotSimulator:
         if self.on_safety_shutoff:
             self.on_safety_shutoff(reason)
 
-    def _schedule_state_change(self, state: CrockpotState) -> None:
-        """Callback for schedule-driven state changes."""
+    def _on_schedule_transition(self, step_index: int, step: "ScheduleStep") -> None:
+        """Callback when the schedule begins a step; applies the step's state."""
+        state = step.state
         old_state = self._state
         self._state = state
         self._apply_relay_state()
@@ -241,10 +250,6 @@ class CrockpotSimulator:
         # Schedule completed - device stays in last state
         pass
 
-    def _on_step_change(self, step_index: int, step: "ScheduleStep") -> None:
-        """Callback when schedule advances to a new step."""
-        pass
-
     # Schedule control methods
     def start_schedule(self, schedule: "Schedule") -> bool:
         """Start a cooking schedule."""
@@ -265,7 +270,7 @@ class CrockpotSimulator:
     def update_config(self, safety_temp_f: float, control_interval_ms: int) -> None:
         """Update configuration from parsed header values."""
         self.safety_temp_f = safety_temp_f
-        self.control_interval_ms = control_interval_ms
+        self.control_interval_ms = max(control_interval_ms, self.MIN_CONTROL_INTERVAL_MS)
 
     def state_from_string(self, s: str) -> CrockpotState | None:
         """Parse state from string (case-insensitive)."""
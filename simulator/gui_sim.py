@@ -15,7 +15,6 @@ Screens:
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from collections import deque
-from typing import TYPE_CHECKING
 
 from rich.align import Align
 from rich.console import Console, Group, RenderableType
@@ -25,9 +24,7 @@ from rich.table import Table
 from rich.text import Text
 
 from crockpot_sim import CrockpotState, CrockpotStatus
-
-if TYPE_CHECKING:
-    from schedule import Schedule, ScheduleStep
+from schedule import Schedule, ScheduleStep
 
 
 class Screen(Enum):
@@ -73,19 +70,40 @@ class DisplayConfig:
     name: str = "320x240 TFT"
 
 
-DISPLAY_PRESETS = {
-    "128x128": DisplayConfig(128, 128, "1.44\" Square"),
-    "240x135": DisplayConfig(240, 135, "1.14\" Wide"),
-    "240x240": DisplayConfig(240, 240, "1.3\" Square"),
-    "320x240": DisplayConfig(320, 240, "2.8\" TFT"),
+# Display presets keyed by (width, height)
+DISPLAY_PRESETS: dict[tuple[int, int], DisplayConfig] = {
+    (128, 128): DisplayConfig(128, 128, "1.44\" Square"),
+    (240, 135): DisplayConfig(240, 135, "1.14\" Wide"),
+    (240, 240): DisplayConfig(240, 240, "1.3\" Square"),
+    (320, 240): DisplayConfig(320, 240, "2.8\" TFT"),
+}
+
+# Same presets keyed by "WxH" name (e.g. "320x240")
+DISPLAY_PRESETS_BY_NAME: dict[str, DisplayConfig] = {
+    f"{w}x{h}": cfg for (w, h), cfg in DISPLAY_PRESETS.items()
 }
 
 
+def _format_temp_f(temp_f: float) -> str:
+    """Format temperature in Fahrenheit."""
+    return f"{temp_f:.0f}F"
+
+
+def _format_temp_c(temp_f: float) -> str:
+    """Format temperature converted to Celsius."""
+    return f"{(temp_f - 32.0) * 5.0 / 9.0:.0f}C"
+
+
+# State cycle order for the schedule builder, with reverse index lookup
+_CROCKPOT_STATES = tuple(CrockpotState)
+_CROCKPOT_STATE_IDX = {s: i for i, s in enumerate(_CROCKPOT_STATES)}
+
+
 # Sparkline characters for temperature graph
 SPARK_CHARS = "_.,-~=+*#"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HistoryEntry:
     """Single entry in temperature history."""
     temperature_f: float
@@ -97,6 +115,7 @@ class GUISimulator:
     """Simulates the crockpot GUI screens."""
 
     HISTORY_SIZE = 60  # Number of history points to display
+    BUILDER_INPUT_CACHE_SIZE = 256  # Cached builder input lines
 
     def __init__(
         self,
@@ -105,6 +124,8 @@ class GUISimulator:
     ):
         self.display = display or DisplayConfig()
         self.theme = theme or Theme()
+        # Panel width in terminal columns; the display is fixed for the simulator's lifetime
+        self._panel_width = min(45, max(30, self.display.width // 8))
         self.current_screen = Screen.MAIN
         self.previous_screen = Screen.MAIN
 
@@ -114,6 +135,7 @@ class GUISimulator:
 
         # Settings
         self.show_celsius: bool = False
+        self._format_temp = _format_temp_f
         self.wifi_ssid: str = "CrockNet"
         self.wifi_connected: bool = True
 
@@ -122,17 +144,25 @@ class GUISimulator:
 
         # Temperature history for graph
         self._temp_history: deque[HistoryEntry] = deque(maxlen=self.HISTORY_SIZE)
+        self._history_render_key: tuple | None = None
+        self._history_render: RenderableType | None = None
 
         # Schedule select state
         self._schedule_list: list["Schedule"] = []
         self._schedule_index: int = 0
+        self._summary_cache: dict[int, Text] = {}  # id(schedule) -> steps summary
 
         # Schedule builder state
-        self._builder_steps: list[tuple[CrockpotState, int]] = []  # (state, duration_seconds)
+        self._builder_states: list[CrockpotState] = []  # Parallel lists, one entry per step
+        self._builder_durations: list[int] = []  # duration_seconds
         self._builder_cursor: int = 0  # 0=state, 1=hours, 2=minutes
         self._builder_state: CrockpotState = CrockpotState.HIGH
         self._builder_hours: int = 1
         self._builder_minutes: int = 0
+        self._builder_steps_version: int = 0  # Bumped whenever the step lists change
+        self._builder_steps_line_version: int = -1  # _builder_steps_version the line was built at
+        self._builder_steps_line: Text | None = None
+        self._builder_input_cache: dict[tuple, Text] = {}
 
         # Settings menu state
         self._settings_index: int = 0
@@ -140,6 +170,16 @@ class GUISimulator:
         # Menu screen state
         self._menu_index: int = 0
 
+        # Screen renderer dispatch
+        self._screen_renderers = {
+            Screen.MAIN: self._render_main_screen,
+            Screen.MENU: self._render_menu_screen,
+            Screen.SCHEDULE_SELECT: self._render_schedule_select_screen,
+            Screen.SCHEDULE_BUILDER: self._render_schedule_builder_screen,
+            Screen.HISTORY: self._render_history_screen,
+            Screen.SETTINGS: self._render_settings_screen,
+        }
+
     # =========================================================================
     # Navigation
     # =========================================================================
@@ -195,9 +235,14 @@ class GUISimulator:
         )
         self._temp_history.append(entry)
 
+    def format_temperature(self, temp_f: float) -> str:
+        """Format a temperature in the currently selected unit."""
+        return self._format_temp(temp_f)
+
     def set_schedule_list(self, schedules: list["Schedule"]) -> None:
         """Set available schedules for selection screen."""
         self._schedule_list = schedules
+        self._summary_cache.clear()
         if self._schedule_index >= len(schedules):
             self._schedule_index = 0
 
@@ -224,13 +269,6 @@ class GUISimulator:
         }
         return colors.get(state, self.theme.text)
 
-    def _format_temp(self, temp_f: float) -> str:
-        """Format temperature with unit."""
-        if self.show_celsius:
-            temp_c = (temp_f - 32.0) * 5.0 / 9.0
-            return f"{temp_c:.0f}C"
-        return f"{temp_f:.0f}F"
-
     def _format_duration(self, seconds: int) -> str:
         """Format duration as Xh Ym."""
         if seconds == 0:
@@ -320,16 +358,20 @@ class GUISimulator:
                 prefix = ">" if i == self._schedule_index else " "
                 style = "bold" if i == self._schedule_index else ""
 
-                # Show schedule name and summary
-                steps_summary = " > ".join(
-                    f"{s.state.name[0]}{self._format_duration(s.duration_seconds)}"
-                    for s in schedule.steps[:3]
-                )
-                if len(schedule.steps) > 3:
-                    steps_summary += "..."
+                # Show schedule name and summary (built once per schedule list)
+                summary = self._summary_cache.get(id(schedule))
+                if summary is None:
+                    steps_summary = " > ".join(
+                        f"{s.state.name[0]}{self._format_duration(s.duration_seconds)}"
+                        for s in schedule.steps[:3]
+                    )
+                    if len(schedule.steps) > 3:
+                        steps_summary += "..."
+                    summary = Text(f"   {steps_summary}", style=self.theme.text_dim)
+                    self._summary_cache[id(schedule)] = summary
 
                 lines.append(Text(f"{prefix} {schedule.name}", style=style))
-                lines.append(Text(f"   {steps_summary}", style=self.theme.text_dim))
+                lines.append(summary)
 
         lines.append(Text(""))
         lines.append(Text("[UP/DOWN] select  [ENTER] start", style=self.theme.text_dim))
@@ -342,29 +384,40 @@ class GUISimulator:
         lines.append(Text("Build Schedule", style=Style(color=self.theme.accent, bold=True)))
         lines.append(Text(""))
 
-        # Current steps
-        if self._builder_steps:
-            steps_text = " > ".join(
-                f"{s.name[0]}{self._format_duration(d)}"
-                for s, d in self._builder_steps
-            )
-            lines.append(Text(steps_text, style=self.theme.text))
-        else:
-            lines.append(Text("(no steps yet)", style=self.theme.text_dim))
+        # Current steps (rebuilt only when a step is added or cleared)
+        if self._builder_steps_line_version != self._builder_steps_version:
+            if self._builder_states:
+                steps_text = " > ".join(
+                    f"{s.name[0]}{self._format_duration(d)}"
+                    for s, d in zip(self._builder_states, self._builder_durations)
+                )
+                self._builder_steps_line = Text(steps_text, style=self.theme.text)
+            else:
+                self._builder_steps_line = Text("(no steps yet)", style=self.theme.text_dim)
+            self._builder_steps_line_version = self._builder_steps_version
+        lines.append(self._builder_steps_line)
 
         lines.append(Text(""))
 
         # Current input
-        state_color = self._get_state_color(self._builder_state)
-        state_style = Style(color=state_color, bold=True, reverse=self._builder_cursor == 0)
-        hours_style = Style(bold=True, reverse=self._builder_cursor == 1)
-        mins_style = Style(bold=True, reverse=self._builder_cursor == 2)
-
-        input_line = Text("Add: ")
-        input_line.append(self._builder_state.name, style=state_style)
-        input_line.append(" ")
-        input_line.append(f"{self._builder_hours}h", style=hours_style)
-        input_line.append(f"{self._builder_minutes:02d}m", style=mins_style)
+        input_key = (self._builder_cursor, self._builder_state, self._builder_hours, self._builder_minutes)
+        input_line = self._builder_input_cache.get(input_key)
+        if input_line is None:
+            state_color = self._get_state_color(self._builder_state)
+            state_style = Style(color=state_color, bold=True, reverse=self._builder_cursor == 0)
+            hours_style = Style(bold=True, reverse=self._builder_cursor == 1)
+            mins_style = Style(bold=True, reverse=self._builder_cursor == 2)
+
+            input_line = Text("Add: ")
+            input_line.append(self._builder_state.name, style=state_style)
+            input_line.append(" ")
+            input_line.append(f"{self._builder_hours}h", style=hours_style)
+            input_line.append(f"{self._builder_minutes:02d}m", style=mins_style)
+
+            # Evict oldest entry once full (dicts keep insertion order)
+            if len(self._builder_input_cache) >= self.BUILDER_INPUT_CACHE_SIZE:
+                del self._builder_input_cache[next(iter(self._builder_input_cache))]
+            self._builder_input_cache[input_key] = input_line
         lines.append(input_line)
 
         lines.append(Text(""))
@@ -374,41 +427,47 @@ class GUISimulator:
 
     def _render_history_screen(self) -> RenderableType:
         """Render temperature history graph."""
-        lines = []
-        lines.append(Text("Temperature History", style=Style(color=self.theme.accent, bold=True)))
-        lines.append(Text(""))
-
         if not self._temp_history:
-            lines.append(Text("No data yet", style=self.theme.text_dim))
-        else:
-            # Temperature range
-            temps = [e.temperature_f for e in self._temp_history]
-            min_t = min(temps)
-            max_t = max(temps)
-            current_t = temps[-1]
-
-            # Stats line
-            lines.append(Text(f"Now: {current_t:.0f}F  Min: {min_t:.0f}F  Max: {max_t:.0f}F", style=self.theme.text_dim))
-            lines.append(Text(""))
-
-            # Sparkline graph
-            range_t = max(max_t - min_t, 10)  # Minimum range of 10F
-            sparkline = ""
-            for entry in self._temp_history:
-                norm = (entry.temperature_f - min_t) / range_t
-                norm = max(0, min(1, norm))
-                idx = int(norm * (len(SPARK_CHARS) - 1))
-                sparkline += SPARK_CHARS[idx]
-
-            lines.append(Text(sparkline, style=self.theme.accent))
-
-            # State timeline
-            state_line = ""
-            for entry in self._temp_history:
-                state_line += entry.state.name[0]  # O, W, L, H
-            lines.append(Text(state_line, style=self.theme.text_dim))
-
-        return Align.center(Group(*lines))
+            return Align.center(Group(
+                Text("Temperature History", style=Style(color=self.theme.accent, bold=True)),
+                Text(""),
+                Text("No data yet", style=self.theme.text_dim),
+            ))
+
+        # Temperature range
+        temps = [e.temperature_f for e in self._temp_history]
+        min_t = min(temps)
+        max_t = max(temps)
+        current_t = temps[-1]
+
+        # Quantize to sparkline indices; steady-state cooks produce the same
+        # indices frame after frame, so reuse the last render when nothing
+        # visible has changed.
+        range_t = max(max_t - min_t, 10)  # Minimum range of 10F
+        scale = len(SPARK_CHARS) - 1
+        spark_idx = tuple(
+            int(max(0, min(1, (t - min_t) / range_t)) * scale) for t in temps
+        )
+        stats_line = f"Now: {current_t:.0f}F  Min: {min_t:.0f}F  Max: {max_t:.0f}F"
+        state_line = "".join(e.state.name[0] for e in self._temp_history)  # O, W, L, H
+
+        key = (spark_idx, stats_line, state_line)
+        if key == self._history_render_key:
+            return self._history_render
+
+        sparkline = "".join(SPARK_CHARS[i] for i in spark_idx)
+
+        rendered = Align.center(Group(
+            Text("Temperature History", style=Style(color=self.theme.accent, bold=True)),
+            Text(""),
+            Text(stats_line, style=self.theme.text_dim),
+            Text(""),
+            Text(sparkline, style=self.theme.accent),
+            Text(state_line, style=self.theme.text_dim),
+        ))
+        self._history_render_key = key
+        self._history_render = rendered
+        return rendered
 
     def _render_settings_screen(self) -> RenderableType:
         """Render settings screen."""
@@ -462,9 +521,8 @@ class GUISimulator:
                 self._schedule_index = (self._schedule_index - 1) % len(self._schedule_list)
         elif self.current_screen == Screen.SCHEDULE_BUILDER:
             if self._builder_cursor == 0:
-                states = list(CrockpotState)
-                idx = states.index(self._builder_state)
-                self._builder_state = states[(idx - 1) % len(states)]
+                idx = _CROCKPOT_STATE_IDX[self._builder_state]
+                self._builder_state = _CROCKPOT_STATES[(idx - 1) % len(_CROCKPOT_STATES)]
             elif self._builder_cursor == 1:
                 self._builder_hours = min(24, self._builder_hours + 1)
             elif self._builder_cursor == 2:
@@ -481,9 +539,8 @@ class GUISimulator:
                 self._schedule_index = (self._schedule_index + 1) % len(self._schedule_list)
         elif self.current_screen == Screen.SCHEDULE_BUILDER:
             if self._builder_cursor == 0:
-                states = list(CrockpotState)
-                idx = states.index(self._builder_state)
-                self._builder_state = states[(idx + 1) % len(states)]
+                idx = _CROCKPOT_STATE_IDX[self._builder_state]
+                self._builder_state = _CROCKPOT_STATES[(idx + 1) % len(_CROCKPOT_STATES)]
             elif self._builder_cursor == 1:
                 self._builder_hours = max(0, self._builder_hours - 1)
             elif self._builder_cursor == 2:
@@ -513,32 +570,42 @@ class GUISimulator:
         elif self.current_screen == Screen.SCHEDULE_BUILDER:
             # Add current step
             duration = self._builder_hours * 3600 + self._builder_minutes * 60
-            self._builder_steps.append((self._builder_state, duration))
+            self._builder_states.append(self._builder_state)
+            self._builder_durations.append(duration)
+            self._builder_steps_version += 1
             # Reset for next step
             self._builder_hours = 1
             self._builder_minutes = 0
         elif self.current_screen == Screen.SETTINGS:
             if self._settings_index == 2:  # Temperature unit
                 self.show_celsius = not self.show_celsius
+                self._format_temp = _format_temp_c if self.show_celsius else _format_temp_f
         return None
 
     def get_built_schedule(self) -> "Schedule | None":
         """Get the schedule from builder and clear it."""
-        if not self._builder_steps:
+        if not self._builder_states:
             return None
 
-        from schedule import Schedule, ScheduleStep
         steps = [
             ScheduleStep(state=state, duration_seconds=duration)
-            for state, duration in self._builder_steps
+            for state, duration in zip(self._builder_states, self._builder_durations)
         ]
-        schedule = Schedule(name="Custom", steps=steps)
-        self._builder_steps = []
+        try:
+            schedule = Schedule(name="Custom", steps=steps)
+        except ValueError:
+            self.show_message("ONLY LAST STEP CAN BE 0h00m", is_error=True)
+            return None
+        self._builder_states = []
+        self._builder_durations = []
+        self._builder_steps_version += 1
         return schedule
 
     def clear_builder(self) -> None:
         """Clear the schedule builder."""
-        self._builder_steps = []
+        self._builder_states = []
+        self._builder_durations = []
+        self._builder_steps_version += 1
         self._builder_cursor = 0
         self._builder_state = CrockpotState.HIGH
         self._builder_hours = 1
@@ -550,16 +617,7 @@ class GUISimulator:
 
     def render(self) -> Panel:
         """Render the complete simulated display."""
-        screen_renderers = {
-            Screen.MAIN: self._render_main_screen,
-            Screen.MENU: self._render_menu_screen,
-            Screen.SCHEDULE_SELECT: self._render_schedule_select_screen,
-            Screen.SCHEDULE_BUILDER: self._render_schedule_builder_screen,
-            Screen.HISTORY: self._render_history_screen,
-            Screen.SETTINGS: self._render_settings_screen,
-        }
-
-        renderer = screen_renderers.get(self.current_screen, self._render_main_screen)
+        renderer = self._screen_renderers.get(self.current_screen, self._render_main_screen)
         screen_content = renderer()
 
         # Add message overlay if present
@@ -567,14 +625,11 @@ class GUISimulator:
         if overlay:
             screen_content = Group(screen_content, Text(""), overlay)
 
-        # Panel sizing
-        panel_width = min(45, max(30, self.display.width // 8))
-
         return Panel(
             screen_content,
             title=f"[{self.display.name}]",
             subtitle=f"[dim]{self.current_screen.name}[/]",
-            width=panel_width,
+            width=self._panel_width,
             height=14,
             style=f"on {self.theme.background}",
             border_style=self.theme.text_dim,
@@ -20,8 +20,8 @@ Controls:
         v - Cycle view mode (DEVICE / DEBUG / SPLIT)
         1 - Main screen
         2 - Settings screen
-        3 - WiFi screen
-        4 - Info screen
+        3 - Schedules screen
+        4 - History screen
         b - Go back to previous screen
         SPACE - Dismiss message overlay
 
@@ -32,15 +32,40 @@ Controls:
     q - Quit
 """
 
+import queue
 import sys
 import threading
 import time
+from functools import partial
 from pathlib import Path
+from typing import Callable
 
 # Platform-specific keyboard input
 if sys.platform == "win32":
+    import ctypes
     import msvcrt
 
+    _WAIT_OBJECT_0 = 0
+
+    def wait_for_key(timeout: float) -> bool:
+        """Block until a keypress is available or timeout expires (Windows)."""
+        kernel32 = ctypes.windll.kernel32
+        handle = msvcrt.get_osfhandle(sys.stdin.fileno())
+        deadline = time.monotonic() + timeout
+        while True:
+            if msvcrt.kbhit():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if kernel32.WaitForSingleObject(handle, max(1, int(remaining * 1000))) != _WAIT_OBJECT_0:
+                return False
+            # The handle is also signalled by key-up, focus, mouse and resize
+            # records, which getch() never consumes; drop them or every later
+            # wait would return immediately
+            if not msvcrt.kbhit():
+                kernel32.FlushConsoleInputBuffer(handle)
+
     def get_key() -> str | None:
         """Get a keypress without blocking (Windows)."""
         if msvcrt.kbhit():
@@ -52,37 +77,65 @@ if sys.platform == "win32":
             return ch.decode('utf-8', errors='ignore').lower()
         return None
 else:
+    import os
     import select
     import tty
     import termios
 
     _old_settings = None
+    _poller = None
 
     def _setup_terminal():
-        global _old_settings
+        global _old_settings, _poller
         fd = sys.stdin.fileno()
         _old_settings = termios.tcgetattr(fd)
         tty.setcbreak(fd)
 
+        # Register stdin once with poll() instead of building an fd set for
+        # select() on every call (macOS poll() does not support ttys)
+        if sys.platform != "darwin":
+            _poller = select.poll()
+            _poller.register(fd, select.POLLIN)
+
+    def _stdin_ready(timeout: float) -> bool:
+        """Check whether stdin has input within timeout seconds."""
+        if _poller:
+            return bool(_poller.poll(timeout * 1000))
+        return bool(select.select([sys.stdin], [], [], timeout)[0])
+
     def _restore_terminal():
         global _old_settings
         if _old_settings:
             fd = sys.stdin.fileno()
             termios.tcsetattr(fd, termios.TCSADRAIN, _old_settings)
 
+    def wait_for_key(timeout: float) -> bool:
+        """Block until stdin is readable or timeout expires (Unix/Mac)."""
+        return _stdin_ready(timeout)
+
     def get_key() -> str | None:
         """Get a keypress without blocking (Unix/Mac)."""
-        if select.select([sys.stdin], [], [], 0)[0]:
-            ch = sys.stdin.read(1)
-            return ch.lower()
+        if _stdin_ready(0):
+            # Read the fd directly: sys.stdin's buffer would swallow the rest
+            # of a burst where poll() can no longer see it
+            ch = os.read(sys.stdin.fileno(), 1)
+            return ch.decode("utf-8", errors="ignore").lower()
         return None
 
-from rich.console import Console
-from rich.live import Live
+try:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.markup import escape
+    from rich.text import Text
+except ImportError:
+    print("Error: 'rich' library required. Install with:")
+    print("  pip install rich")
+    sys.exit(1)
 
 try:
     from watchdog.observers import Observer
-    from watchdog.events import FileSystemEventHandler, FileModifiedEvent
+    from watchdog.observers.polling import PollingObserver
+    from watchdog.events import PatternMatchingEventHandler, FileModifiedEvent
     WATCHDOG_AVAILABLE = True
 except ImportError:
     WATCHDOG_AVAILABLE = False
@@ -99,33 +152,59 @@ SCRIPT_DIR = Path(__file__).parent
 FIRMWARE_DIR = SCRIPT_DIR.parent / "firmware"
 
 
-class ConfigFileHandler(FileSystemEventHandler):
+class ConfigFileHandler(PatternMatchingEventHandler):
     """Handles file system events for header files."""
 
+    # Quiet period after the last event before reloading
+    DEBOUNCE_SECONDS = 0.25
+
     def __init__(self, callback):
+        super().__init__(patterns=["*.h"], ignore_directories=True)
         self.callback = callback
-        self._last_reload = 0
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._pending_path: Path | None = None
 
     def on_modified(self, event):
         if isinstance(event, FileModifiedEvent):
-            # Debounce - ignore events within 1 second
-            now = time.time()
-            if now - self._last_reload < 1.0:
-                return
-            self._last_reload = now
-
             path = Path(event.src_path)
-            if path.suffix == ".h":
-                self.callback(path)
+
+            # Debounce - restart the timer so a burst of saves reloads once,
+            # after the last one
+            with self._lock:
+                if self._timer:
+                    self._timer.cancel()
+                self._pending_path = path
+                self._timer = threading.Timer(self.DEBOUNCE_SECONDS, self._fire)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _fire(self):
+        with self._lock:
+            path = self._pending_path
+            self._pending_path = None
+            self._timer = None
+        if path:
+            self.callback(path)
 
 
 class SimulatorApp:
     """Main application coordinating simulator, TUI, and file watcher."""
 
+    REFRESH_PER_SECOND = 4  # Maximum display refresh rate
+    IDLE_REFRESH_PER_SECOND = 1  # Wakeup rate while the display is idle
+    POLLING_INTERVAL_SECONDS = 30.0  # Header poll interval without native watching
+
     def __init__(self):
         self.console = Console()
         self.running = False
         self._config_version = 0
+        self._dirty = True  # Display needs a redraw
+
+        # Log messages from background threads, applied to the TUI on the main thread
+        self._msg_queue: queue.Queue[str | Text] = queue.Queue()
+        # Set by the file watcher thread; the reload itself runs on the main thread
+        self._reload_requested = threading.Event()
 
         # Parse initial config
         self.config_parser = ConfigParser(FIRMWARE_DIR)
@@ -142,29 +221,67 @@ class SimulatorApp:
         # Create TUI
         self.tui = CrockpotTUI(self.simulator)
 
-        # Remote control (Telegram + Web)
+        # Remote control (Telegram + Web) and the control loop
         self.remote_control = RemoteControlManager(
             simulator=self.simulator,
             on_message=self._on_remote_message,
+            on_control_tick=self._on_control_tick,
         )
 
         # File watcher
         self.observer = None
 
+        # Key bindings (q is handled separately in _handle_key)
+        self._key_table: dict[str, Callable[[], None]] = {
+            # State controls
+            'o': partial(self._set_state, CrockpotState.OFF),
+            'w': partial(self._set_state, CrockpotState.WARM),
+            'l': partial(self._set_state, CrockpotState.LOW),
+            'h': partial(self._set_state, CrockpotState.HIGH),
+            # View mode toggle
+            'v': self.tui.cycle_view_mode,
+            # GUI screen navigation (1-4)
+            '1': partial(self.tui.set_gui_screen, Screen.MAIN),
+            '2': partial(self.tui.set_gui_screen, Screen.SETTINGS),
+            '3': partial(self.tui.set_gui_screen, Screen.SCHEDULE_SELECT),
+            '4': partial(self.tui.set_gui_screen, Screen.HISTORY),
+            # Back key
+            'b': self.tui.gui_go_back,
+            # Error injection
+            'e': self._toggle_sensor_error,
+            # Status (debug)
+            's': self._show_status,
+            # Dismiss message overlay
+            ' ': self.tui.gui.dismiss_message,
+        }
+
     def _on_state_change(self, state: CrockpotState) -> None:
         """Callback when state changes."""
-        self.tui.add_message(f"State changed to {state.name}")
+        self._msg_queue.put_nowait(Text(f"State changed to {state.name}"))
 
     def _on_safety_shutoff(self, reason: str) -> None:
         """Callback when safety shutoff triggers."""
-        self.tui.add_message(f"[red bold]SAFETY SHUTOFF: {reason}[/]")
+        self._msg_queue.put_nowait(Text(f"SAFETY SHUTOFF: {reason}", style="red bold"))
 
-    def _on_remote_message(self, message: str) -> None:
+    def _on_remote_message(self, message: str | Text) -> None:
         """Callback for messages from remote control services."""
-        self.tui.add_message(message)
+        self._msg_queue.put_nowait(message)
+
+    def _drain_messages(self) -> None:
+        """Apply queued background messages to the TUI."""
+        try:
+            while True:
+                self.tui.add_message(self._msg_queue.get_nowait())
+                self._dirty = True
+        except queue.Empty:
+            pass
 
     def _on_config_reload(self, path: Path) -> None:
-        """Callback when config file changes."""
+        """Callback when config file changes (file watcher thread)."""
+        self._reload_requested.set()
+
+    def _apply_config_reload(self) -> None:
+        """Re-read the headers and push the new config to the simulator and TUI."""
         config = self.config_parser.parse_all()
         self.simulator.update_config(
             safety_temp_f=config.get("CROCKPOT_SAFETY_TEMP_F", 300.0),
@@ -172,6 +289,7 @@ class SimulatorApp:
         )
         self._config_version += 1
         self.tui.notify_config_reload(self._config_version)
+        self._dirty = True
 
     def _setup_file_watcher(self) -> None:
         """Set up file system watcher for header files."""
@@ -180,91 +298,70 @@ class SimulatorApp:
             return
 
         if not FIRMWARE_DIR.exists():
-            self.tui.add_message(f"[yellow]Firmware dir not found: {FIRMWARE_DIR}[/]")
+            self.tui.add_message(f"[yellow]Firmware dir not found: {escape(str(FIRMWARE_DIR))}[/]")
             return
 
         handler = ConfigFileHandler(self._on_config_reload)
-        self.observer = Observer()
 
         # Watch the main directory
         watch_dir = FIRMWARE_DIR / "main"
-        if watch_dir.exists():
-            self.observer.schedule(handler, str(watch_dir), recursive=False)
-            self.tui.add_message(f"Watching {watch_dir} for changes")
+        if not watch_dir.exists():
+            return
 
-        self.observer.start()
+        # Prefer the OS-native observer (inotify/FSEvents/ReadDirectoryChangesW);
+        # fall back to slow polling if it can't be started (e.g. inotify limits)
+        try:
+            self.observer = Observer()
+            self.observer.schedule(handler, str(watch_dir), recursive=False)
+            self.observer.start()
+        except OSError:
+            self.observer = PollingObserver(timeout=self.POLLING_INTERVAL_SECONDS)
+            self.observer.schedule(handler, str(watch_dir), recursive=False)
+            self.observer.start()
+            self.tui.add_message("[yellow]Native file watching unavailable - polling headers[/]")
+
+        self.tui.add_message(f"Watching {escape(str(watch_dir))} for changes")
+
+    def _on_control_tick(self) -> None:
+        """Callback after each control loop iteration."""
+        self._dirty = True
+
+    def _set_state(self, state: CrockpotState) -> None:
+        """Set crockpot state from a keypress."""
+        self.simulator.set_state(state)
+        self.tui.add_message(f"Set state to {state.name}")
+        self.tui.gui.show_message(state.name, is_error=False)
+
+    def _toggle_sensor_error(self) -> None:
+        """Inject or clear a simulated sensor error."""
+        status = self.simulator.get_status()
+        new_error = not status.sensor_error
+        self.simulator.inject_sensor_error(new_error)
+        state = "injected" if new_error else "cleared"
+        self.tui.add_message(f"Sensor error {state}")
+        if new_error:
+            self.tui.gui.show_message("SENSOR ERROR", is_error=True)
+        else:
+            self.tui.gui.dismiss_message()
 
-    def _control_loop_thread(self) -> None:
-        """Background thread running the control loop."""
-        while self.running:
-            self.simulator.control_loop()
-            time.sleep(1.0)
+    def _show_status(self) -> None:
+        """Log a one-line status summary."""
+        status = self.simulator.get_status()
+        self.tui.add_message(
+            f"State: {status.state.name}, "
+            f"Temp: {status.temperature_f:.1f} F, "
+            f"Relay: {'ON' if status.relay_main else 'OFF'}"
+        )
 
     def _handle_key(self, key: str) -> bool:
         """Handle a keypress. Returns False to quit."""
         if key == 'q':
             return False
 
-        # State controls
-        elif key == 'o':
-            self.simulator.set_state(CrockpotState.OFF)
-            self.tui.add_message("Set state to OFF")
-            self.tui.gui.show_message("OFF", is_error=False)
-        elif key == 'w':
-            self.simulator.set_state(CrockpotState.WARM)
-            self.tui.add_message("Set state to WARM")
-            self.tui.gui.show_message("WARM", is_error=False)
-        elif key == 'l':
-            self.simulator.set_state(CrockpotState.LOW)
-            self.tui.add_message("Set state to LOW")
-            self.tui.gui.show_message("LOW", is_error=False)
-        elif key == 'h':
-            self.simulator.set_state(CrockpotState.HIGH)
-            self.tui.add_message("Set state to HIGH")
-            self.tui.gui.show_message("HIGH", is_error=False)
-
-        # View mode toggle
-        elif key == 'v':
-            self.tui.cycle_view_mode()
-
-        # GUI screen navigation (1-4)
-        elif key == '1':
-            self.tui.set_gui_screen(Screen.MAIN)
-        elif key == '2':
-            self.tui.set_gui_screen(Screen.SETTINGS)
-        elif key == '3':
-            self.tui.set_gui_screen(Screen.WIFI)
-        elif key == '4':
-            self.tui.set_gui_screen(Screen.INFO)
-
-        # Back key (escape or b)
-        elif key == 'b':
-            self.tui.gui_go_back()
-
-        # Error injection
-        elif key == 'e':
-            status = self.simulator.get_status()
-            new_error = not status.sensor_error
-            self.simulator.inject_sensor_error(new_error)
-            state = "injected" if new_error else "cleared"
-            self.tui.add_message(f"Sensor error {state}")
-            if new_error:
-                self.tui.gui.show_message("SENSOR ERROR", is_error=True)
-            else:
-                self.tui.gui.dismiss_message()
-
-        # Status (debug)
-        elif key == 's':
-            status = self.simulator.get_status()
-            self.tui.add_message(
-                f"State: {status.state.name}, "
-                f"Temp: {status.temperature_f:.1f} F, "
-                f"Relay: {'ON' if status.relay_main else 'OFF'}"
-            )
-
-        # Dismiss message overlay
-        elif key == ' ':
-            self.tui.gui.dismiss_message()
+        handler = self._key_table.get(key)
+        if handler:
+            handler()
+            self._dirty = True
 
         return True
 
@@ -279,27 +376,49 @@ class SimulatorApp:
         # Set up file watcher
         self._setup_file_watcher()
 
-        # Start remote control services (Telegram + Web)
+        # Start the control loop and remote control services (Telegram + Web)
         self.remote_control.start()
 
-        # Start control loop thread
-        control_thread = threading.Thread(target=self._control_loop_thread, daemon=True)
-        control_thread.start()
-
         try:
-            with Live(self.tui.render(), refresh_per_second=4, console=self.console) as live:
+            with Live(self.tui.render(), auto_refresh=False, console=self.console) as live:
                 self.tui.add_message("[bold]v[/]=view [bold]1-4[/]=screen [bold]o/w/l/h[/]=state [bold]q[/]=quit")
 
+                refresh_interval = 1.0 / self.REFRESH_PER_SECOND
+                idle_interval = 1.0 / self.IDLE_REFRESH_PER_SECOND
+                last_render = 0.0
+
                 while self.running:
-                    # Check for keypress
-                    key = get_key()
-                    if key:
-                        if not self._handle_key(key):
+                    # Sleep until a keypress arrives or a pending redraw is due;
+                    # wake less often while nothing visible has been changing
+                    if self._dirty:
+                        timeout = last_render + refresh_interval - time.monotonic()
+                    elif self.tui.is_idle:
+                        timeout = idle_interval
+                    else:
+                        timeout = refresh_interval
+                    if timeout > 0 and wait_for_key(timeout):
+                        # Handle every buffered keypress before redrawing
+                        while key := get_key():
+                            if not self._handle_key(key):
+                                self.running = False
+                                break
+                        if not self.running:
                             break
 
-                    # Update display
-                    live.update(self.tui.render())
-                    time.sleep(0.1)
+                    self._drain_messages()
+                    if self._reload_requested.is_set():
+                        self._reload_requested.clear()
+                        self._apply_config_reload()
+
+                    # Update display only when something has changed, at most
+                    # once per refresh interval so bursts coalesce into one render
+                    now = time.monotonic()
+                    if self._dirty and now - last_render >= refresh_interval:
+                        self._dirty = False
+                        last_render = now
+                        # Skip the Rich layout pass when nothing visible changed
+                        if self.tui.needs_redraw():
+                            live.update(self.tui.render(), refresh=True)
 
         except KeyboardInterrupt:
             pass
@@ -322,14 +441,6 @@ class SimulatorApp:
 
 def main():
     """Entry point."""
-    # Check for Rich library
-    try:
-        import rich
-    except ImportError:
-        print("Error: 'rich' library required. Install with:")
-        print("  pip install rich")
-        sys.exit(1)
-
     app = SimulatorApp()
     app.run()
 
@@ -1,46 +1,80 @@
 """
 Remote control manager for the crockpot simulator.
-Coordinates Telegram bot and web server in a background asyncio thread.
+Runs the simulator control loop, Telegram bot and web server on a single
+asyncio event loop in a background thread.
 """
 
 import asyncio
+import concurrent.futures
 import logging
 import os
 import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
+from rich.markup import escape
+from rich.text import Text
+
+# uvloop is optional; fall back to the default asyncio event loop
+try:
+    import uvloop
+
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
 if TYPE_CHECKING:
     from crockpot_sim import CrockpotSimulator
 
 logger = logging.getLogger(__name__)
 
 
+# Parsed .env files keyed by path: (mtime, variables)
+_ENV_CACHE: dict[Path, tuple[float, dict[str, str]]] = {}
+
+
 def load_env_file(path: Path) -> dict[str, str]:
-    """Load environment variables from a .env file."""
+    """Load environment variables from a .env file.
+
+    The parsed result is cached and only re-read when the file's mtime changes.
+    """
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return {}
+
+    cached = _ENV_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return dict(cached[1])
+
     env_vars = {}
-    if path.exists():
-        with open(path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, value = line.partition("=")
-                    # Remove quotes if present
-                    value = value.strip().strip('"').strip("'")
-                    env_vars[key.strip()] = value
-    return env_vars
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, _, value = line.partition("=")
+                # Remove quotes if present
+                value = value.strip().strip('"').strip("'")
+                env_vars[key.strip()] = value
+
+    _ENV_CACHE[path] = (mtime, env_vars)
+    return dict(env_vars)
 
 
 class RemoteControlManager:
     """
     Manages remote control interfaces (Telegram, Web) in a background thread.
+
+    The simulator control loop runs as a task on the same event loop, so
+    simulator callbacks fire on the same thread as remote commands.
     """
 
     def __init__(
         self,
         simulator: "CrockpotSimulator",
-        on_message: Callable[[str], None] | None = None,
+        on_message: Callable[[str | Text], None] | None = None,
         web_port: int = 8080,
+        on_control_tick: Callable[[], None] | None = None,
     ):
         """
         Initialize the remote control manager.
@@ -49,13 +83,16 @@ class RemoteControlManager:
             simulator: CrockpotSimulator instance to control
             on_message: Callback for log messages to display in TUI
             web_port: Port for web server (default: 8080)
+            on_control_tick: Callback after each control loop iteration
         """
         self.simulator = simulator
         self.on_message = on_message
         self.web_port = web_port
+        self.on_control_tick = on_control_tick
 
         self._thread: threading.Thread | None = None
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
         self._telegram_bot = None
         self._web_server = None
         self._running = False
@@ -70,23 +107,64 @@ class RemoteControlManager:
         # Get Telegram token from environment
         self.telegram_token = os.environ.get("TELEGRAM_BOT_TOKEN", "")
 
-    def _log(self, message: str) -> None:
-        """Log a message to TUI and logger."""
+    def _log(self, message: str | Text) -> None:
+        """Log a message to TUI and logger.
+
+        Strings may contain Rich markup; per-command messages are passed as
+        prebuilt Text so the TUI does not re-parse markup for each one.
+        """
         logger.info(message)
         if self.on_message:
             self.on_message(message)
 
     def _on_telegram_command(self, command: str, response: str) -> None:
         """Callback when Telegram command is received."""
-        self._log(f"[cyan]Telegram[/] {command}")
+        self._log(Text.assemble(("Telegram", "cyan"), f" {command}"))
 
     def _on_web_command(self, endpoint: str, response: str) -> None:
         """Callback when web command is received."""
-        self._log(f"[green]Web[/] {endpoint}")
+        self._log(Text.assemble(("Web", "green"), f" {endpoint}"))
+
+    async def _control_loop(self) -> None:
+        """
+        Run simulator.control_loop() every control interval.
+
+        Sleeps until a fixed deadline rather than a fixed delay, so the period
+        stays at CROCKPOT_CONTROL_INTERVAL_MS regardless of control_loop() time.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        last_error: str | None = None
+        while True:
+            interval = self.simulator.control_interval_ms / 1000.0
+            # Keep ticking after a failed tick; a dead task would freeze the UI
+            # on its last state. Repeats of the same error are reported once.
+            try:
+                self.simulator.control_loop(dt=interval)
+                if self.on_control_tick:
+                    self.on_control_tick()
+                if self._web_server:
+                    self._web_server.notify_status()
+            except Exception as e:
+                error = repr(e)
+                if error != last_error:
+                    logger.exception("Control loop tick failed")
+                    self._log(f"[red]Control loop error:[/] {escape(str(e))}")
+                last_error = error
+            else:
+                last_error = None
+
+            deadline += interval
+            delay = deadline - loop.time()
+            if delay <= 0:
+                # Fell behind - resync instead of running a burst of catch-up ticks
+                deadline = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
 
     async def _run_services(self) -> None:
-        """Run all remote control services."""
-        tasks = []
+        """Run the control loop and all remote control services."""
+        tasks = [asyncio.create_task(self._control_loop())]
 
         # Start web server
         try:
@@ -100,7 +178,7 @@ class RemoteControlManager:
             await self._web_server.start()
             self._log(f"[green]Web server[/] http://localhost:{self.web_port}")
         except Exception as e:
-            self._log(f"[red]Web server failed:[/] {e}")
+            self._log(f"[red]Web server failed:[/] {escape(str(e))}")
 
         # Start Telegram bot if token is configured
         if self.telegram_token:
@@ -115,18 +193,23 @@ class RemoteControlManager:
                 await self._telegram_bot.start()
                 self._log("[cyan]Telegram bot[/] connected")
             except Exception as e:
-                self._log(f"[red]Telegram bot failed:[/] {e}")
+                self._log(f"[red]Telegram bot failed:[/] {escape(str(e))}")
         else:
             self._log("[yellow]Telegram[/] not configured (set TELEGRAM_BOT_TOKEN)")
 
         # Keep running until stopped
         try:
-            while self._running:
-                await asyncio.sleep(0.5)
+            await self._stop_event.wait()
         except asyncio.CancelledError:
             pass
 
         # Cleanup
+        for task in tasks:
+            task.cancel()
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error("Remote control task failed", exc_info=result)
+
         if self._telegram_bot:
             await self._telegram_bot.stop()
         if self._web_server:
@@ -134,8 +217,9 @@ class RemoteControlManager:
 
     def _thread_main(self) -> None:
         """Main function for the background thread."""
-        self._loop = asyncio.new_event_loop()
+        self._loop = _new_event_loop()
         asyncio.set_event_loop(self._loop)
+        self._stop_event = asyncio.Event()
 
         try:
             self._loop.run_until_complete(self._run_services())
@@ -153,13 +237,22 @@ class RemoteControlManager:
         self._thread = threading.Thread(target=self._thread_main, daemon=True)
         self._thread.start()
 
+    async def _signal_stop(self) -> None:
+        """Wake _run_services so it can shut services down."""
+        self._stop_event.set()
+
     def stop(self) -> None:
         """Stop all remote control services."""
         self._running = False
 
-        if self._loop:
-            # Signal the async loop to stop
-            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._loop and self._stop_event:
+            # Let _run_services run its cleanup on the loop thread
+            try:
+                future = asyncio.run_coroutine_threadsafe(self._signal_stop(), self._loop)
+                future.result(timeout=2)
+            except (RuntimeError, concurrent.futures.TimeoutError):
+                # Loop already closed or unresponsive
+                pass
 
         if self._thread:
             self._thread.join(timeout=2)
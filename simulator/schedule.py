@@ -4,16 +4,39 @@ Schedule management for programmable cooking programs.
 Supports multi-step cooking schedules like "HIGH 3h -> LOW 6h -> WARM".
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import accumulate
 from pathlib import Path
 from typing import Callable
 import json
+import logging
+import os
+import time
 
 from crockpot_sim import CrockpotState
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# orjson is optional; fall back to the stdlib json module
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+@dataclass(slots=True)
 class ScheduleStep:
     """A single step in a cooking schedule."""
     state: CrockpotState
@@ -35,20 +58,45 @@ class ScheduleStep:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Schedule:
     """A complete cooking schedule with multiple steps."""
     name: str
     steps: list[ScheduleStep] = field(default_factory=list)
     repeat: bool = False
+    # Memoized to_dict() result; call invalidate() after mutating
+    _cached_dict: dict | None = field(default=None, init=False, repr=False, compare=False)
+    # Sum of step durations, computed in __post_init__ and invalidate()
+    _total: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._validate()
+        self._total = sum(s.duration_seconds for s in self.steps)
+
+    def _validate(self) -> None:
+        """Only the final step may be indefinite (duration 0)."""
+        for step in self.steps[:-1]:
+            if step.duration_seconds <= 0:
+                raise ValueError(f"Schedule '{self.name}': only the last step can be indefinite")
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "name": self.name,
-            "steps": [step.to_dict() for step in self.steps],
-            "repeat": self.repeat,
-        }
+        """Convert to dictionary for JSON serialization.
+
+        The dict is memoized and shared between calls; treat it as read-only.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "name": self.name,
+                "steps": [step.to_dict() for step in self.steps],
+                "repeat": self.repeat,
+            }
+        return self._cached_dict
+
+    def invalidate(self) -> None:
+        """Revalidate and drop cached values after the schedule changes."""
+        self._validate()
+        self._cached_dict = None
+        self._total = sum(s.duration_seconds for s in self.steps)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Schedule":
@@ -62,7 +110,7 @@ class Schedule:
     @property
     def total_duration_seconds(self) -> int:
         """Total duration of all steps (excludes indefinite final step)."""
-        return sum(s.duration_seconds for s in self.steps)
+        return self._total
 
     def format_duration(self, seconds: int) -> str:
         """Format duration as human-readable string."""
@@ -109,31 +157,59 @@ class ScheduleManager:
     """
     Manages schedule execution.
 
-    Call tick() every second from the control loop.
+    When a schedule starts, the end offset of each timed step is precomputed,
+    and the active step is looked up from the monotonic clock by bisecting
+    that timeline. tick() only detects step transitions and fires callbacks;
+    call it regularly (e.g. every control loop iteration) so they fire promptly.
     """
 
     # Default path for custom schedules
     DEFAULT_SCHEDULE_PATH = Path.home() / ".crockpot" / "schedules.json"
 
+    # Directories already created by a save, shared across instances
+    _ensured_dirs: set[Path] = set()
+
     def __init__(
         self,
         on_state_change: Callable[[CrockpotState], None] | None = None,
         on_schedule_complete: Callable[[str], None] | None = None,
         on_step_change: Callable[[int, ScheduleStep], None] | None = None,
         schedule_path: Path | None = None,
+        on_transition: Callable[[int, ScheduleStep], None] | None = None,
     ):
-        self._on_state_change = on_state_change
+        """
+        Args:
+            on_state_change: Deprecated, use on_transition
+            on_schedule_complete: Called with the schedule name when it finishes
+            on_step_change: Deprecated, use on_transition
+            schedule_path: JSON file for custom schedules
+            on_transition: Called with (step index, step) whenever a step begins
+        """
+        if on_transition is None and (on_state_change or on_step_change):
+            # Adapt the old per-field callbacks into a single transition callback
+            def on_transition(index: int, step: ScheduleStep) -> None:
+                if on_state_change:
+                    on_state_change(step.state)
+                if on_step_change:
+                    on_step_change(index, step)
+
+        self._on_transition = on_transition
         self._on_schedule_complete = on_schedule_complete
-        self._on_step_change = on_step_change
         self._schedule_path = schedule_path or self.DEFAULT_SCHEDULE_PATH
 
         # Current schedule state
         self._active_schedule: Schedule | None = None
-        self._current_step_index: int = 0
-        self._step_elapsed_seconds: int = 0
+        self._start_monotonic: float = 0.0
+        self._cum_ends: list[int] = []  # End offset of each timed step up to the first indefinite one
+        self._has_tail: bool = False  # Whether the timeline ends in an indefinite step
+        self._position: tuple[int, int] = (0, 0)  # (cycle, step index) last reported to callbacks
 
         # Available schedules (presets + custom)
         self._custom_schedules: list[Schedule] = []
+        # Entries from schedules.json that failed to load; written back unchanged on save
+        self._unloadable_schedules: list = []
+        self._all_schedules_cache: list[Schedule] | None = None
+        self._name_index: dict[str, Schedule] | None = None
         self._load_custom_schedules()
 
     @property
@@ -149,26 +225,36 @@ class ScheduleManager:
     @property
     def current_step_index(self) -> int:
         """Index of the current step (0-based)."""
-        return self._current_step_index
+        if not self._active_schedule:
+            return 0
+        _, index, _ = self._current_step_from_clock()
+        return min(index, len(self._active_schedule.steps) - 1)
 
     @property
     def current_step(self) -> ScheduleStep | None:
         """The current step being executed."""
-        if self._active_schedule and self._current_step_index < len(self._active_schedule.steps):
-            return self._active_schedule.steps[self._current_step_index]
+        if not self._active_schedule:
+            return None
+        _, index, _ = self._current_step_from_clock()
+        if index < len(self._active_schedule.steps):
+            return self._active_schedule.steps[index]
         return None
 
     @property
     def step_elapsed_seconds(self) -> int:
         """Seconds elapsed in current step."""
-        return self._step_elapsed_seconds
+        if not self._active_schedule:
+            return 0
+        return self._current_step_from_clock()[2]
 
     @property
     def step_remaining_seconds(self) -> int:
         """Seconds remaining in current step (0 if indefinite)."""
-        step = self.current_step
-        if step and step.duration_seconds > 0:
-            return max(0, step.duration_seconds - self._step_elapsed_seconds)
+        if not self._active_schedule:
+            return 0
+        _, index, elapsed = self._current_step_from_clock()
+        if index < len(self._cum_ends):
+            return self._active_schedule.steps[index].duration_seconds - elapsed
         return 0
 
     @property
@@ -181,92 +267,97 @@ class ScheduleManager:
     @property
     def all_schedules(self) -> list[Schedule]:
         """All available schedules (presets + custom)."""
-        return PRESET_SCHEDULES + self._custom_schedules
+        if self._all_schedules_cache is None:
+            self._all_schedules_cache = PRESET_SCHEDULES + self._custom_schedules
+        return self._all_schedules_cache
 
     def start(self, schedule: Schedule) -> None:
         """Start executing a schedule."""
         if not schedule.steps:
             return
 
+        # Timed steps up to the first indefinite one; later steps are unreachable
+        durations = []
+        for step in schedule.steps:
+            if step.duration_seconds <= 0:
+                break
+            durations.append(step.duration_seconds)
+
         self._active_schedule = schedule
-        self._current_step_index = 0
-        self._step_elapsed_seconds = 0
+        self._cum_ends = list(accumulate(durations))
+        self._has_tail = len(durations) < len(schedule.steps)
+        self._position = (0, 0)
+        self._start_monotonic = time.monotonic()
 
         # Apply first step's state
-        first_step = schedule.steps[0]
-        if self._on_state_change:
-            self._on_state_change(first_step.state)
-        if self._on_step_change:
-            self._on_step_change(0, first_step)
+        if self._on_transition:
+            self._on_transition(0, schedule.steps[0])
 
     def stop(self) -> None:
         """Stop the current schedule."""
         self._active_schedule = None
-        self._current_step_index = 0
-        self._step_elapsed_seconds = 0
+        self._cum_ends = []
+        self._position = (0, 0)
 
     def tick(self) -> None:
         """
-        Advance the schedule by one second.
+        Fire callbacks if the clock has moved into a new step.
 
-        Call this every second from the control loop.
+        Call this regularly from the control loop.
         """
         if not self._active_schedule:
             return
 
-        step = self.current_step
-        if not step:
+        cycle, index, _ = self._current_step_from_clock()
+        if (cycle, index) == self._position:
             return
-
-        self._step_elapsed_seconds += 1
-
-        # Check if step is complete (duration > 0 means timed step)
-        if step.duration_seconds > 0 and self._step_elapsed_seconds >= step.duration_seconds:
-            self._advance_step()
-
-    def _advance_step(self) -> None:
-        """Advance to the next step in the schedule."""
-        if not self._active_schedule:
+        self._position = (cycle, index)
+
+        if index >= len(self._active_schedule.steps):
+            # Schedule complete
+            schedule_name = self._active_schedule.name
+            self.stop()
+            if self._on_schedule_complete:
+                self._on_schedule_complete(schedule_name)
             return
 
-        next_index = self._current_step_index + 1
-
-        # Check if we've reached the end
-        if next_index >= len(self._active_schedule.steps):
-            if self._active_schedule.repeat:
-                # Restart from beginning
-                next_index = 0
-            else:
-                # Schedule complete
-                schedule_name = self._active_schedule.name
-                self._active_schedule = None
-                self._current_step_index = 0
-                self._step_elapsed_seconds = 0
-                if self._on_schedule_complete:
-                    self._on_schedule_complete(schedule_name)
-                return
+        if self._on_transition:
+            self._on_transition(index, self._active_schedule.steps[index])
 
-        # Move to next step
-        self._current_step_index = next_index
-        self._step_elapsed_seconds = 0
+    def _current_step_from_clock(self) -> tuple[int, int, int]:
+        """
+        Locate the active step from the monotonic clock.
 
-        next_step = self._active_schedule.steps[next_index]
-        if self._on_state_change:
-            self._on_state_change(next_step.state)
-        if self._on_step_change:
-            self._on_step_change(next_index, next_step)
+        Returns (repeat cycle, step index, seconds into the step). A step
+        index equal to the number of steps means the schedule has finished.
+        """
+        elapsed = int(time.monotonic() - self._start_monotonic)
+        cum_ends = self._cum_ends
+        cycle = 0
+        if not self._has_tail and elapsed >= cum_ends[-1]:
+            if not self._active_schedule.repeat:
+                return 0, len(cum_ends), 0
+            cycle, elapsed = divmod(elapsed, cum_ends[-1])
+
+        # Past the last timed step only when the timeline ends in an indefinite step
+        index = bisect_right(cum_ends, elapsed)
+        step_start = cum_ends[index - 1] if index else 0
+        return cycle, index, elapsed - step_start
 
     def add_custom_schedule(self, schedule: Schedule) -> None:
         """Add a custom schedule and save to disk."""
+        schedule.invalidate()
         # Check if a schedule with this name already exists
         for i, s in enumerate(self._custom_schedules):
             if s.name == schedule.name:
                 self._custom_schedules[i] = schedule
                 self._save_custom_schedules()
+                self._invalidate_schedule_cache()
                 return
 
         self._custom_schedules.append(schedule)
         self._save_custom_schedules()
+        self._invalidate_schedule_cache()
 
     def remove_custom_schedule(self, name: str) -> bool:
         """Remove a custom schedule by name."""
@@ -274,65 +365,115 @@ class ScheduleManager:
             if s.name == name:
                 del self._custom_schedules[i]
                 self._save_custom_schedules()
+                self._invalidate_schedule_cache()
                 return True
         return False
 
     def get_schedule_by_name(self, name: str) -> Schedule | None:
         """Find a schedule by name."""
-        for schedule in self.all_schedules:
-            if schedule.name == name:
-                return schedule
-        return None
+        return self._get_name_index().get(name)
+
+    def _get_name_index(self) -> dict[str, Schedule]:
+        """Name -> schedule lookup, built on first use."""
+        if self._name_index is None:
+            index: dict[str, Schedule] = {}
+            for schedule in self.all_schedules:
+                # First match wins, so presets shadow custom schedules of the same name
+                index.setdefault(schedule.name, schedule)
+            self._name_index = index
+        return self._name_index
+
+    def _invalidate_schedule_cache(self) -> None:
+        """Drop cached schedule lists after custom schedules change."""
+        self._all_schedules_cache = None
+        self._name_index = None
 
     def _load_custom_schedules(self) -> None:
         """Load custom schedules from JSON file."""
+        self._invalidate_schedule_cache()
         if not self._schedule_path.exists():
             return
 
         try:
-            with open(self._schedule_path, "r") as f:
-                data = json.load(f)
-            self._custom_schedules = [Schedule.from_dict(s) for s in data.get("schedules", [])]
-        except (json.JSONDecodeError, KeyError, ValueError):
+            data = _loads(self._schedule_path.read_bytes())
+            entries = data.get("schedules", [])
+        except (ValueError, AttributeError):
             # Invalid file, start fresh
             self._custom_schedules = []
+            self._unloadable_schedules = []
+            return
+
+        # Load schedules one by one so a single bad entry (e.g. a mid-schedule
+        # 0h00m step saved by older builders) does not discard the rest
+        self._custom_schedules = []
+        self._unloadable_schedules = []
+        for entry in entries:
+            try:
+                self._custom_schedules.append(Schedule.from_dict(entry))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping invalid schedule in {self._schedule_path}: {e}")
+                self._unloadable_schedules.append(entry)
 
     def _save_custom_schedules(self) -> None:
         """Save custom schedules to JSON file."""
-        # Ensure directory exists
-        self._schedule_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure directory exists (once per directory)
+        parent = self._schedule_path.parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            ScheduleManager._ensured_dirs.add(parent)
 
         data = {
-            "schedules": [s.to_dict() for s in self._custom_schedules],
+            "schedules": [s.to_dict() for s in self._custom_schedules] + self._unloadable_schedules,
         }
 
-        with open(self._schedule_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Write to a sibling temp file and rename over the target so readers never
+        # see a partially written file
+        tmp_path = self._schedule_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_dumps(data))
+        os.replace(tmp_path, self._schedule_path)
 
     def format_status(self) -> str:
         """Format current schedule status as string."""
-        if not self._active_schedule:
+        schedule = self._active_schedule
+        if not schedule:
             return "No schedule"
 
-        step = self.current_step
-        if not step:
+        _, index, elapsed = self._current_step_from_clock()
+        steps = schedule.steps
+        total_steps = len(steps)
+        if index >= total_steps:
             return "No schedule"
+        step = steps[index]
 
-        step_num = self._current_step_index + 1
-        total_steps = len(self._active_schedule.steps)
-        state_name = step.state.name
+        prefix = f"{schedule.name} - Step {index + 1}/{total_steps}: {step.state.name}"
+        if index < len(self._cum_ends):
+            mins, secs = divmod(step.duration_seconds - elapsed, 60)
+            return f"{prefix} ({mins}:{secs:02d} left)"
+        return f"{prefix} (indefinite)"
 
-        if step.duration_seconds > 0:
-            remaining = self.step_remaining_seconds
-            mins = remaining // 60
-            secs = remaining % 60
-            return f"{self._active_schedule.name} - Step {step_num}/{total_steps}: {state_name} ({mins}:{secs:02d} left)"
-        else:
-            return f"{self._active_schedule.name} - Step {step_num}/{total_steps}: {state_name} (indefinite)"
+    def get_step_info(self) -> tuple[int, int, int, float]:
+        """
+        Current step details from a single clock lookup.
+
+        Returns (step index, total steps, seconds remaining, progress 0.0-1.0).
+        Remaining and progress are 0 for indefinite steps.
+        """
+        schedule = self._active_schedule
+        if not schedule:
+            return 0, 0, 0, 0.0
+
+        _, index, elapsed = self._current_step_from_clock()
+        total_steps = len(schedule.steps)
+        if index >= total_steps:
+            return total_steps - 1, total_steps, 0, 0.0
+        if index < len(self._cum_ends):
+            duration = schedule.steps[index].duration_seconds
+            return index, total_steps, duration - elapsed, elapsed / duration
+        return index, total_steps, 0, 0.0
 
     def get_step_progress(self) -> float:
         """Get progress through current step (0.0 to 1.0)."""
         step = self.current_step
         if not step or step.duration_seconds == 0:
             return 0.0
-        return min(1.0, self._step_elapsed_seconds / step.duration_seconds)
+        return min(1.0, self.step_elapsed_seconds / step.duration_seconds)
@@ -10,11 +10,52 @@ from typing import TYPE_CHECKING, Callable
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 
+from crockpot_sim import CrockpotState
+
 if TYPE_CHECKING:
-    from crockpot_sim import CrockpotSimulator, CrockpotState
+    from crockpot_sim import CrockpotSimulator
 
 logger = logging.getLogger(__name__)
 
+# Status message matching firmware format
+STATUS_TEMPLATE = (
+    "🍲 Crockpot Status:\n"
+    "State: {state}\n"
+    "Temperature: {temperature:.1f}°F\n"
+    "Uptime: {uptime} seconds\n"
+    "WiFi: {wifi}\n"
+    "Sensor: {sensor}"
+)
+SCHEDULE_TEMPLATE = "\nSchedule: {name} (Step {step}/{total})"
+
+WIFI_CONNECTED = "Connected"
+WIFI_DISCONNECTED = "Disconnected"
+SENSOR_ERROR = "ERROR ⚠️"
+SENSOR_OK = "OK ✓"
+
+HELP_MESSAGE = (
+    "🍲 IoT Crockpot Commands:\n"
+    "/status - Show current status\n"
+    "/off - Turn off\n"
+    "/warm - Set to warm\n"
+    "/low - Set to low\n"
+    "/high - Set to high\n"
+    "/help - Show this help"
+)
+
+OFF_RESPONSE = "Crockpot turned OFF"
+WARM_RESPONSE = "Crockpot set to WARM 🔥"
+LOW_RESPONSE = "Crockpot set to LOW 🔥🔥"
+HIGH_RESPONSE = "Crockpot set to HIGH 🔥🔥🔥"
+
+# Command name -> (state to apply, reply text)
+STATE_COMMANDS: dict[str, tuple[CrockpotState, str]] = {
+    "off": (CrockpotState.OFF, OFF_RESPONSE),
+    "warm": (CrockpotState.WARM, WARM_RESPONSE),
+    "low": (CrockpotState.LOW, LOW_RESPONSE),
+    "high": (CrockpotState.HIGH, HIGH_RESPONSE),
+}
+
 
 class TelegramBot:
     """Telegram bot that controls the crockpot simulator."""
@@ -43,35 +84,26 @@ class TelegramBot:
         """Build status message matching firmware format."""
         status = self.simulator.get_status()
 
-        lines = [
-            "🍲 Crockpot Status:",
-            f"State: {status.state.name}",
-            f"Temperature: {status.temperature_f:.1f}°F",
-            f"Uptime: {status.uptime_seconds} seconds",
-            f"WiFi: {'Connected' if status.wifi_connected else 'Disconnected'}",
-            f"Sensor: {'ERROR ⚠️' if status.sensor_error else 'OK ✓'}",
-        ]
+        message = STATUS_TEMPLATE.format_map({
+            "state": status.state.name,
+            "temperature": status.temperature_f,
+            "uptime": status.uptime_seconds,
+            "wifi": WIFI_CONNECTED if status.wifi_connected else WIFI_DISCONNECTED,
+            "sensor": SENSOR_ERROR if status.sensor_error else SENSOR_OK,
+        })
 
         if status.schedule_active:
-            lines.append(f"Schedule: {status.schedule_name} (Step {status.schedule_step + 1}/{status.schedule_total_steps})")
+            message += SCHEDULE_TEMPLATE.format(
+                name=status.schedule_name,
+                step=status.schedule_step + 1,
+                total=status.schedule_total_steps,
+            )
 
-        return "\n".join(lines)
+        return message
 
     def _build_help_message(self) -> str:
         """Build help message matching firmware format."""
-        return (
-            "🍲 IoT Crockpot Commands:\n"
-            "/status - Show current status\n"
-            "/off - Turn off\n"
-            "/warm - Set to warm\n"
-            "/low - Set to low\n"
-            "/high - Set to high\n"
-            "/help - Show this help"
-        )
-
-    async def _cmd_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /start command."""
-        await self._cmd_status(update, context)
+        return HELP_MESSAGE
 
     async def _cmd_status(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /status command."""
@@ -80,41 +112,18 @@ class TelegramBot:
         if self.on_command:
             self.on_command("/status", response)
 
-    async def _cmd_off(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /off command."""
-        from crockpot_sim import CrockpotState
-        self.simulator.set_state(CrockpotState.OFF)
-        response = "Crockpot turned OFF"
-        await update.message.reply_text(response)
-        if self.on_command:
-            self.on_command("/off", response)
-
-    async def _cmd_warm(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /warm command."""
-        from crockpot_sim import CrockpotState
-        self.simulator.set_state(CrockpotState.WARM)
-        response = "Crockpot set to WARM 🔥"
-        await update.message.reply_text(response)
-        if self.on_command:
-            self.on_command("/warm", response)
+    def _make_setter(self, command: str) -> Callable:
+        """Build the handler for a /off, /warm, /low or /high command."""
+        state, response = STATE_COMMANDS[command]
+        name = f"/{command}"
 
-    async def _cmd_low(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /low command."""
-        from crockpot_sim import CrockpotState
-        self.simulator.set_state(CrockpotState.LOW)
-        response = "Crockpot set to LOW 🔥🔥"
-        await update.message.reply_text(response)
-        if self.on_command:
-            self.on_command("/low", response)
+        async def handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+            self.simulator.set_state(state)
+            await update.message.reply_text(response)
+            if self.on_command:
+                self.on_command(name, response)
 
-    async def _cmd_high(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle /high command."""
-        from crockpot_sim import CrockpotState
-        self.simulator.set_state(CrockpotState.HIGH)
-        response = "Crockpot set to HIGH 🔥🔥🔥"
-        await update.message.reply_text(response)
-        if self.on_command:
-            self.on_command("/high", response)
+        return handler
 
     async def _cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle /help command."""
@@ -123,18 +132,23 @@ class TelegramBot:
         if self.on_command:
             self.on_command("/help", response)
 
+    def _command_handlers(self) -> list[tuple[str, Callable]]:
+        """(command name, handler) pairs to register with the application."""
+        handlers = [
+            ("start", self._cmd_status),
+            ("status", self._cmd_status),
+        ]
+        handlers.extend((command, self._make_setter(command)) for command in STATE_COMMANDS)
+        handlers.append(("help", self._cmd_help))
+        return handlers
+
     async def start(self) -> None:
         """Start the bot (async)."""
         self.application = Application.builder().token(self.token).build()
 
         # Register command handlers
-        self.application.add_handler(CommandHandler("start", self._cmd_start))
-        self.application.add_handler(CommandHandler("status", self._cmd_status))
-        self.application.add_handler(CommandHandler("off", self._cmd_off))
-        self.application.add_handler(CommandHandler("warm", self._cmd_warm))
-        self.application.add_handler(CommandHandler("low", self._cmd_low))
-        self.application.add_handler(CommandHandler("high", self._cmd_high))
-        self.application.add_handler(CommandHandler("help", self._cmd_help))
+        for name, callback in self._command_handlers():
+            self.application.add_handler(CommandHandler(name, callback))
 
         self._running = True
         logger.info("Starting Telegram bot polling...")
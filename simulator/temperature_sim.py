@@ -21,6 +21,9 @@ TARGET_TEMPS: dict[State, float] = {
     State.HIGH: 300.0,
 }
 
+# Same targets indexed by State.value (values are contiguous from 0)
+_TARGET_TEMPS_BY_VALUE: tuple[float, ...] = tuple(TARGET_TEMPS[State(v)] for v in range(len(State)))
+
 # Heating rate in degrees F per second (when relay is ON)
 HEATING_RATE = 2.0
 
@@ -37,10 +40,14 @@ ROOM_TEMP = 70.0
 class TemperatureSimulator:
     """Simulates realistic crockpot temperature behavior."""
 
+    __slots__ = ("temperature", "sensor_error", "_error_injected", "_rng", "_noise")
+
     def __init__(self, initial_temp: float = ROOM_TEMP):
         self.temperature = initial_temp
         self.sensor_error = False
         self._error_injected = False
+        self._rng = random.Random()
+        self._noise = self._rng.uniform
 
     def update(self, state: State, relay_on: bool, dt: float = 1.0) -> float:
         """
@@ -59,25 +66,30 @@ class TemperatureSimulator:
             return self.temperature
 
         self.sensor_error = False
-        target = TARGET_TEMPS.get(state, ROOM_TEMP)
+        target = _TARGET_TEMPS_BY_VALUE[state.value]
+        temp = self.temperature
 
-        if relay_on and self.temperature < target:
+        if relay_on and temp < target:
             # Heating: linear rise towards target
-            self.temperature += HEATING_RATE * dt
+            temp += HEATING_RATE * dt
             # Don't overshoot target
-            self.temperature = min(self.temperature, target + 10)
+            if temp > target + 10:
+                temp = target + 10
         else:
             # Cooling: exponential decay towards room temp
-            diff = self.temperature - ROOM_TEMP
-            self.temperature -= diff * COOLING_COEFF * dt
+            temp -= (temp - ROOM_TEMP) * COOLING_COEFF * dt
 
         # Add noise
-        self.temperature += random.uniform(-NOISE_AMPLITUDE, NOISE_AMPLITUDE)
+        temp += self._noise(-NOISE_AMPLITUDE, NOISE_AMPLITUDE)
 
         # Clamp to reasonable bounds
-        self.temperature = max(ROOM_TEMP - 10, min(400, self.temperature))
+        if temp < ROOM_TEMP - 10:
+            temp = ROOM_TEMP - 10
+        elif temp > 400:
+            temp = 400
 
-        return self.temperature
+        self.temperature = temp
+        return temp
 
     def inject_error(self, error: bool) -> None:
         """Inject or clear a sensor error condition."""
@@ -9,21 +9,24 @@ Provides two view modes:
 import time
 from collections import deque
 from enum import Enum, auto
+from functools import cached_property, partial
 from pathlib import Path
-from threading import Lock
+from typing import Callable
 
 from rich.console import Console, Group
 from rich.columns import Columns
 from rich.layout import Layout
 from rich.live import Live
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress_bar import ProgressBar
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
 from crockpot_sim import CrockpotSimulator, CrockpotState, CrockpotStatus
-from gui_sim import GUISimulator, Screen, DISPLAY_PRESETS
-from schedule import PRESET_SCHEDULES
+from gui_sim import GUISimulator, Screen, DISPLAY_PRESETS_BY_NAME
+from schedule import PRESET_SCHEDULES, Schedule
 
 
 class ViewMode(Enum):
@@ -33,46 +36,138 @@ class ViewMode(Enum):
     SPLIT = auto()     # Show both side by side
 
 
+# View mode that follows each mode when cycling
+_NEXT_VIEW_MODE = {
+    ViewMode.DEVICE: ViewMode.DEBUG,
+    ViewMode.DEBUG: ViewMode.SPLIT,
+    ViewMode.SPLIT: ViewMode.DEVICE,
+}
+
+
 # Sparkline characters for temperature history
 # Use ASCII-compatible characters for Windows console compatibility
 # All characters are visible (no spaces)
 SPARKLINE_CHARS = "._-=+*#@"
 
+# Temperature range mapped onto the sparkline characters
+SPARKLINE_MIN_F = 70.0   # Room temp
+SPARKLINE_MAX_F = 320.0  # Above safety temp
+_SPARKLINE_SCALE = (len(SPARKLINE_CHARS) - 1) / (SPARKLINE_MAX_F - SPARKLINE_MIN_F)
+_SPARKLINE_TOP = len(SPARKLINE_CHARS) - 1
+_SPARKLINE_BYTES = SPARKLINE_CHARS.encode("ascii")
+
+# Display color for each crockpot state
+STATE_COLORS = {
+    CrockpotState.OFF: "dim white",
+    CrockpotState.WARM: "yellow",
+    CrockpotState.LOW: "orange1",
+    CrockpotState.HIGH: "red",
+}
+
+# Fixed status panel cells, built once and shared across renders
+_STATE_TEXT = {state: Text(f"[{state.name}]", style=color) for state, color in STATE_COLORS.items()}
+_RELAY_ON = Text("[*] ON", style="green")  # ASCII-compatible indicators
+_RELAY_OFF = Text("[ ] OFF", style="dim")
+_SCHEDULE_NONE = Text("None", style="dim")
+_WIFI_UP = Text("Connected", style="green")
+_WIFI_DOWN = Text("Disconnected", style="red")
+_SENSOR_OK = Text("OK", style="green")
+_SENSOR_ERR = Text("ERROR", style="red bold")
+
+# Temperature cell styles, parsed once (below / at or above the safety limit)
+_TEMP_STYLE = Style(color="white")
+_TEMP_STYLE_ALERT = Style(color="red")
+
+
+def _spark_byte(temp: float) -> int:
+    """Sparkline character (as an ASCII byte) for a single temperature."""
+    if temp <= SPARKLINE_MIN_F:
+        return _SPARKLINE_BYTES[0]
+    if temp >= SPARKLINE_MAX_F:
+        return _SPARKLINE_BYTES[_SPARKLINE_TOP]
+    return _SPARKLINE_BYTES[int((temp - SPARKLINE_MIN_F) * _SPARKLINE_SCALE)]
+
 
 class CrockpotTUI:
     """Terminal UI for the crockpot simulator."""
 
     HISTORY_SIZE = 60  # 60 seconds of history
+    LOG_LINES = 5  # Messages shown in the log panel
+    IDLE_FRAMES = 20  # Frames in a row without activity before the display counts as idle
 
     def __init__(self, simulator: CrockpotSimulator, display_preset: str = "320x240"):
         self.simulator = simulator
         self.console = Console()
-        self.messages: deque[str] = deque(maxlen=10)
+        self.messages: deque[Text] = deque(maxlen=self.LOG_LINES)
         self.temp_history: deque[float] = deque(maxlen=self.HISTORY_SIZE)
+        # Sparkline for temp_history, extended by one character per sample
+        self._spark_buf = bytearray()
+        self._sparkline = ""
         self.running = False
-        self._lock = Lock()
         self._config_version = 0
+        self._message_count = 0
+        self._command_count = 0
+
+        # Last formatted uptime as (seconds, "HH:MM:SS")
+        self._uptime_cache: tuple[int, str] = (-1, "")
+
+        # Formatted log timestamp, reused for messages within the same second
+        self._timestamp_second = -1
+        self._timestamp = ""
+
+        # Redraw tracking for needs_redraw() / is_idle
+        self._last_snapshot_key: tuple | None = None
+        self._last_activity_key: tuple | None = None
+        self._idle_frames = 0
+        # Status fetched by a needs_redraw() that returned True, for the next render()
+        self._pending_status: CrockpotStatus | None = None
+
+        # Log panel and the _message_count it was built at
+        self._messages_panel_count = -1
+        self._messages_panel: Panel | None = None
+
+        # Last rendered device panel and the values it was built from
+        self._device_panel_key: tuple | None = None
+        self._device_panel: Panel | None = None
 
         # View mode
         self.view_mode = ViewMode.SPLIT
 
         # GUI simulator
-        display_config = DISPLAY_PRESETS.get(display_preset, DISPLAY_PRESETS["320x240"])
+        display_config = DISPLAY_PRESETS_BY_NAME.get(display_preset, DISPLAY_PRESETS_BY_NAME["320x240"])
         self.gui = GUISimulator(display=display_config)
 
         # Initialize GUI with schedule list
         self.gui.set_schedule_list(PRESET_SCHEDULES)
 
-    def add_message(self, msg: str) -> None:
-        """Add a message to the log."""
-        with self._lock:
-            timestamp = time.strftime("%H:%M:%S")
-            self.messages.append(f"[dim]{timestamp}[/] {msg}")
+        # Command alias -> handler
+        self._command_table = self._build_command_table()
+
+    def add_message(self, msg: str | Text) -> None:
+        """Add a message to the log.
+
+        Strings are parsed as Rich markup once, here; pass a Text to skip parsing.
+        """
+        if isinstance(msg, str):
+            msg = Text.from_markup(msg)
+        now = int(time.time())
+        if now != self._timestamp_second:
+            self._timestamp_second = now
+            self._timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        line = Text(self._timestamp, style="dim")
+        line.append(" ")
+        line.append_text(msg)
+        self.messages.append(line)
+        self._message_count += 1
 
     def record_temperature(self, temp: float) -> None:
         """Record temperature for history sparkline."""
-        with self._lock:
-            self.temp_history.append(temp)
+        self.temp_history.append(temp)
+        buf = self._spark_buf
+        buf.append(_spark_byte(temp))
+        if len(buf) > self.HISTORY_SIZE:
+            del buf[0]
+        self._sparkline = buf.decode("ascii")
 
     def notify_config_reload(self, version: int) -> None:
         """Notify that config was reloaded."""
@@ -81,70 +176,37 @@ class CrockpotTUI:
 
     def _make_sparkline(self) -> str:
         """Generate sparkline from temperature history."""
-        if not self.temp_history:
-            return ""
-
-        temps = list(self.temp_history)
-        # Normalize to 0-8 range (sparkline chars)
-        min_t = 70.0   # Room temp
-        max_t = 320.0  # Above safety temp
-
-        def normalize(t: float) -> int:
-            norm = (t - min_t) / (max_t - min_t)
-            norm = max(0, min(1, norm))
-            return int(norm * (len(SPARKLINE_CHARS) - 1))
-
-        return "".join(SPARKLINE_CHARS[normalize(t)] for t in temps)
+        return self._sparkline
 
     def _format_uptime(self, seconds: int) -> str:
         """Format uptime as HH:MM:SS."""
-        h = seconds // 3600
-        m = (seconds % 3600) // 60
-        s = seconds % 60
-        return f"{h:02d}:{m:02d}:{s:02d}"
-
-    def _state_color(self, state: CrockpotState) -> str:
-        """Get color for state display."""
-        colors = {
-            CrockpotState.OFF: "dim white",
-            CrockpotState.WARM: "yellow",
-            CrockpotState.LOW: "orange1",
-            CrockpotState.HIGH: "red",
-        }
-        return colors.get(state, "white")
-
-    def _render_status(self, status: CrockpotStatus) -> Panel:
+        if seconds == self._uptime_cache[0]:
+            return self._uptime_cache[1]
+        text = "%02d:%02d:%02d" % (seconds // 3600, (seconds % 3600) // 60, seconds % 60)
+        self._uptime_cache = (seconds, text)
+        return text
+
+    def _render_status(self, status: CrockpotStatus, sparkline: str) -> Panel:
         """Render the status panel."""
+        over_safety = status.temperature_f >= self.simulator.safety_temp_f
+
         table = Table.grid(padding=(0, 2))
         table.add_column(style="bold", width=16)
         table.add_column()
 
         # State
-        state_color = self._state_color(status.state)
-        table.add_row(
-            "State:",
-            Text(f"[{status.state.name}]", style=state_color)
-        )
+        table.add_row("State:", _STATE_TEXT[status.state])
 
         # Temperature
-        temp_str = f"{status.temperature_f:.1f} F"
-        temp_style = "red" if status.temperature_f >= self.simulator.safety_temp_f else "white"
-        table.add_row("Temperature:", Text(temp_str, style=temp_style))
+        temp_str = "%.1f F" % status.temperature_f
+        table.add_row("Temperature:", Text(temp_str, style=_TEMP_STYLE_ALERT if over_safety else _TEMP_STYLE))
 
         # History sparkline
-        sparkline = self._make_sparkline()
         table.add_row("History:", Text(sparkline, style="cyan"))
 
-        # Relays (use ASCII-compatible indicators)
-        main_icon = "[*]" if status.relay_main else "[ ]"
-        main_text = "ON" if status.relay_main else "OFF"
-        main_style = "green" if status.relay_main else "dim"
-        table.add_row("Relay Main:", Text(f"{main_icon} {main_text}", style=main_style))
-
-        aux_icon = "[*]" if status.relay_aux else "[ ]"
-        aux_text = "ON" if status.relay_aux else "OFF"
-        aux_style = "green" if status.relay_aux else "dim"
-        table.add_row("Relay Aux:", Text(f"{aux_icon} {aux_text}", style=aux_style))
+        # Relays
+        table.add_row("Relay Main:", _RELAY_ON if status.relay_main else _RELAY_OFF)
+        table.add_row("Relay Aux:", _RELAY_ON if status.relay_aux else _RELAY_OFF)
 
         # Schedule status
         if status.schedule_active:
@@ -158,20 +220,16 @@ class CrockpotTUI:
                 schedule_text = f"{status.schedule_name} {step_num}/{total_steps} (indefinite)"
             table.add_row("Schedule:", Text(schedule_text, style="cyan"))
         else:
-            table.add_row("Schedule:", Text("None", style="dim"))
+            table.add_row("Schedule:", _SCHEDULE_NONE)
 
         # Uptime
         table.add_row("Uptime:", self._format_uptime(status.uptime_seconds))
 
         # WiFi
-        wifi_text = "Connected" if status.wifi_connected else "Disconnected"
-        wifi_style = "green" if status.wifi_connected else "red"
-        table.add_row("WiFi:", Text(wifi_text, style=wifi_style))
+        table.add_row("WiFi:", _WIFI_UP if status.wifi_connected else _WIFI_DOWN)
 
         # Sensor
-        sensor_text = "ERROR" if status.sensor_error else "OK"
-        sensor_style = "red bold" if status.sensor_error else "green"
-        table.add_row("Sensor:", Text(sensor_text, style=sensor_style))
+        table.add_row("Sensor:", _SENSOR_ERR if status.sensor_error else _SENSOR_OK)
 
         return Panel(
             table,
@@ -179,8 +237,9 @@ class CrockpotTUI:
             border_style="blue",
         )
 
-    def _render_commands(self) -> Panel:
-        """Render the commands panel."""
+    @cached_property
+    def _commands_panel(self) -> Panel:
+        """The commands panel; its content never changes."""
         commands = Text()
 
         # State controls
@@ -213,9 +272,7 @@ class CrockpotTUI:
 
     def cycle_view_mode(self) -> None:
         """Cycle through view modes."""
-        modes = list(ViewMode)
-        current_idx = modes.index(self.view_mode)
-        self.view_mode = modes[(current_idx + 1) % len(modes)]
+        self.view_mode = _NEXT_VIEW_MODE[self.view_mode]
         self.add_message(f"View: {self.view_mode.name}")
 
     def set_gui_screen(self, screen: Screen) -> None:
@@ -229,165 +286,270 @@ class CrockpotTUI:
         self.add_message(f"Screen: {self.gui.current_screen.name}")
 
     def _render_messages(self) -> Panel:
-        """Render the message log panel."""
-        with self._lock:
-            msgs = list(self.messages)
+        """Render the message log panel, rebuilding it only after new messages."""
+        count = self._message_count
+        if count == self._messages_panel_count:
+            return self._messages_panel
 
-        if not msgs:
+        if not self.messages:
             content = Text("Ready for commands...", style="dim")
         else:
-            content = Text("\n".join(msgs[-5:]))
+            content = Text("\n").join(self.messages)
 
-        return Panel(content, title="Log", border_style="dim")
+        self._messages_panel = Panel(content, title="Log", border_style="dim")
+        self._messages_panel_count = count
+        return self._messages_panel
 
-    def _render_debug_view(self, status: CrockpotStatus) -> Group:
+    def _render_debug_view(self, status: CrockpotStatus, sparkline: str) -> Group:
         """Render the debug dashboard view."""
         return Group(
-            self._render_status(status),
+            self._render_status(status, sparkline),
             self._render_messages(),
         )
 
     def _render_device_view(self, status: CrockpotStatus) -> Panel:
-        """Render the simulated device display."""
-        self.gui.update_status(status)
-        return self.gui.render()
+        """Render the simulated device display, reusing the last one if nothing shown changed."""
+        gui = self.gui
+        # The history screen reflects every recorded sample
+        if gui.current_screen == Screen.HISTORY:
+            self._device_panel_key = None
+            return gui.render()
+
+        remaining = status.schedule_step_remaining
+        key = (
+            self._command_count,  # Menu, selection and builder input
+            gui.current_screen,
+            gui.message,
+            gui.message_is_error,
+            status.state,
+            gui.format_temperature(status.temperature_f),
+            status.temperature_f >= 300,
+            status.sensor_error,
+            status.wifi_connected,
+            status.schedule_active,
+            status.schedule_name,
+            remaining // 60 if remaining > 0 else -1,
+        )
+        if key != self._device_panel_key:
+            self._device_panel = gui.render()
+            self._device_panel_key = key
+        return self._device_panel
 
-    def _render_split_view(self, status: CrockpotStatus) -> Columns:
+    def _render_split_view(self, status: CrockpotStatus, sparkline: str) -> Columns:
         """Render device and debug views side by side."""
         device = self._render_device_view(status)
-        debug = self._render_debug_view(status)
+        debug = self._render_debug_view(status, sparkline)
         return Columns([device, debug], expand=True)
 
+    def needs_redraw(self) -> bool:
+        """Whether anything visible changed since the last call that returned True.
+
+        When it returns True, the status it compared is kept and used by the
+        next render(), so a frame fetches the status only once.
+        """
+        status = self.simulator.get_status()
+        key = self._snapshot_key(status)
+
+        activity = key[0]
+        if activity == self._last_activity_key:
+            self._idle_frames += 1
+        else:
+            self._last_activity_key = activity
+            self._idle_frames = 0
+
+        if key == self._last_snapshot_key:
+            return False
+        self._last_snapshot_key = key
+        self._pending_status = status
+        return True
+
+    @property
+    def is_idle(self) -> bool:
+        """True after IDLE_FRAMES consecutive frames without activity.
+
+        Sensor noise, the uptime clock and schedule countdowns still redraw the
+        screen, but they change at most once per control tick, so they do not
+        keep the display out of idle.
+        """
+        return self._idle_frames > self.IDLE_FRAMES
+
+    def snapshot_key(self) -> tuple:
+        """Key of everything that drives visible output.
+
+        Two calls returning equal keys render identically, so callers can skip
+        the redraw.
+        """
+        return self._snapshot_key(self.simulator.get_status())
+
+    def _snapshot_key(self, status: CrockpotStatus) -> tuple:
+        """snapshot_key() for an already fetched status; element 0 is the activity key."""
+        # Uptime is only displayed in the debug dashboard
+        uptime = None if self.view_mode == ViewMode.DEVICE else status.uptime_seconds
+        return (
+            self._activity_key(status),
+            round(status.temperature_f, 1),
+            uptime,
+            status.schedule_step_remaining,
+        )
+
+    def _activity_key(self, status: CrockpotStatus) -> tuple:
+        """Displayed values that change only through commands, messages or state changes."""
+        return (
+            self.view_mode,
+            self.gui.current_screen,
+            self.gui.message,
+            self.gui.message_is_error,
+            self._message_count,
+            self._command_count,
+            self._config_version,
+            status.state,
+            status.relay_main,
+            status.relay_aux,
+            status.sensor_error,
+            status.wifi_connected,
+            status.schedule_active,
+            status.schedule_name,
+            status.schedule_step,
+        )
+
     def render(self) -> Group:
         """Render the complete TUI based on current view mode."""
-        status = self.simulator.get_status()
+        # One status snapshot per frame, threaded through every view; get_status()
+        # returns a fresh object, so it is never updated underneath the render
+        status = self._pending_status or self.simulator.get_status()
+        self._pending_status = None
         self.record_temperature(status.temperature_f)
+        device_visible = self.view_mode != ViewMode.DEBUG
+        if device_visible:
+            self.gui.update_status(status)
+
+        # Skipping unchanged frames is left to needs_redraw(); the panels below
+        # keep their own caches for the parts that did not change
+        sparkline = self._make_sparkline()
 
         # Render based on view mode
         if self.view_mode == ViewMode.DEVICE:
             main_content = self._render_device_view(status)
         elif self.view_mode == ViewMode.DEBUG:
-            main_content = self._render_debug_view(status)
+            main_content = self._render_debug_view(status, sparkline)
         else:  # SPLIT
-            main_content = self._render_split_view(status)
+            main_content = self._render_split_view(status, sparkline)
 
         return Group(
             main_content,
-            self._render_commands(),
+            self._commands_panel,
         )
 
-    def handle_command(self, cmd: str) -> bool:
-        """
-        Handle a user command.
-        Returns False if should quit.
-        """
-        cmd = cmd.strip().lower()
+    def _build_command_table(self) -> dict[str, Callable[[], None]]:
+        """Map every command alias to its handler."""
+        table: dict[str, Callable[[], None]] = {}
 
-        if cmd in ("/quit", "/q", "q"):
-            return False
+        def add(aliases: tuple[str, ...], handler: Callable[[], None]) -> None:
+            for alias in aliases:
+                table[alias] = handler
 
         # State controls
-        if cmd in ("/off", "o"):
-            self.simulator.stop_schedule()
-            self.simulator.set_state(CrockpotState.OFF)
-            self.add_message("Set state to OFF")
-
-        elif cmd in ("/warm", "w"):
-            self.simulator.stop_schedule()
-            self.simulator.set_state(CrockpotState.WARM)
-            self.add_message("Set state to WARM")
-
-        elif cmd in ("/low", "l"):
-            self.simulator.stop_schedule()
-            self.simulator.set_state(CrockpotState.LOW)
-            self.add_message("Set state to LOW")
-
-        elif cmd in ("/high", "h"):
-            self.simulator.stop_schedule()
-            self.simulator.set_state(CrockpotState.HIGH)
-            self.add_message("Set state to HIGH")
-
-        elif cmd in ("/error", "e"):
-            status = self.simulator.get_status()
-            new_error = not status.sensor_error
-            self.simulator.inject_sensor_error(new_error)
-            state = "injected" if new_error else "cleared"
-            self.add_message(f"Sensor error {state}")
+        add(("/off", "o"), partial(self._cmd_set_state, CrockpotState.OFF))
+        add(("/warm", "w"), partial(self._cmd_set_state, CrockpotState.WARM))
+        add(("/low", "l"), partial(self._cmd_set_state, CrockpotState.LOW))
+        add(("/high", "h"), partial(self._cmd_set_state, CrockpotState.HIGH))
+        add(("/error", "e"), self._cmd_toggle_error)
 
         # Screen navigation
-        elif cmd == "m":
-            self.gui.open_menu()
-            self.add_message("Menu")
-
-        elif cmd in ("tab", "\t", "n"):
-            self.gui.next_screen()
-            self.add_message(f"Screen: {self.gui.current_screen.name}")
-
-        elif cmd in ("shift+tab", "b"):
-            self.gui.prev_screen()
-            self.add_message(f"Screen: {self.gui.current_screen.name}")
+        add(("m",), self._cmd_menu)
+        add(("tab", "\t", "n"), self._cmd_next_screen)
+        add(("shift+tab", "b"), self._cmd_prev_screen)
 
         # Menu navigation (arrow keys)
-        elif cmd in ("up", "k"):
-            self.gui.handle_up()
-
-        elif cmd in ("down", "j"):
-            self.gui.handle_down()
-
-        elif cmd in ("left", ","):
-            self.gui.handle_left()
-
-        elif cmd in ("right", "."):
-            self.gui.handle_right()
-
-        elif cmd in ("enter", ""):
-            schedule = self.gui.handle_enter()
-            if schedule:
-                self.simulator.start_schedule(schedule)
-                self.add_message(f"Started: {schedule.name}")
-            # Check if builder has a schedule ready
-            if self.gui.current_screen == Screen.SCHEDULE_BUILDER:
-                built = self.gui.get_built_schedule()
-                if built:
-                    self.simulator.start_schedule(built)
-                    self.add_message(f"Started custom schedule")
+        add(("up", "k"), self.gui.handle_up)
+        add(("down", "j"), self.gui.handle_down)
+        add(("left", ","), self.gui.handle_left)
+        add(("right", "."), self.gui.handle_right)
+        add(("enter", ""), self._cmd_enter)
 
         # Schedule commands
-        elif cmd in ("/stop", "s"):
-            self.simulator.stop_schedule()
-            self.add_message("Schedule stopped")
+        add(("/stop", "s"), self._cmd_stop_schedule)
 
         # Quick schedule presets
-        elif cmd == "1":
-            if len(PRESET_SCHEDULES) > 0:
-                self.simulator.start_schedule(PRESET_SCHEDULES[0])
-                self.add_message(f"Started: {PRESET_SCHEDULES[0].name}")
-
-        elif cmd == "2":
-            if len(PRESET_SCHEDULES) > 1:
-                self.simulator.start_schedule(PRESET_SCHEDULES[1])
-                self.add_message(f"Started: {PRESET_SCHEDULES[1].name}")
-
-        elif cmd == "3":
-            if len(PRESET_SCHEDULES) > 2:
-                self.simulator.start_schedule(PRESET_SCHEDULES[2])
-                self.add_message(f"Started: {PRESET_SCHEDULES[2].name}")
+        for i, schedule in enumerate(PRESET_SCHEDULES[:3]):
+            add((str(i + 1),), partial(self._cmd_start_preset, schedule))
 
         # View mode
-        elif cmd == "v":
-            self.cycle_view_mode()
+        add(("v",), self.cycle_view_mode)
 
         # Export command
-        elif cmd in ("/export", "x"):
-            if self.simulator.datalog:
-                filename = self.simulator.datalog.generate_filename("csv")
-                export_path = Path.home() / ".crockpot" / filename
-                self.simulator.datalog.to_csv(export_path)
-                self.add_message(f"[green]Exported to {export_path}[/]")
-            else:
-                self.add_message("[red]Datalog not enabled[/]")
+        add(("/export", "x"), self._cmd_export)
+
+        return table
+
+    def _cmd_set_state(self, state: CrockpotState) -> None:
+        self.simulator.stop_schedule()
+        self.simulator.set_state(state)
+        self.add_message(f"Set state to {state.name}")
+
+    def _cmd_toggle_error(self) -> None:
+        status = self.simulator.get_status()
+        new_error = not status.sensor_error
+        self.simulator.inject_sensor_error(new_error)
+        state = "injected" if new_error else "cleared"
+        self.add_message(f"Sensor error {state}")
+
+    def _cmd_menu(self) -> None:
+        self.gui.open_menu()
+        self.add_message("Menu")
+
+    def _cmd_next_screen(self) -> None:
+        self.gui.next_screen()
+        self.add_message(f"Screen: {self.gui.current_screen.name}")
+
+    def _cmd_prev_screen(self) -> None:
+        self.gui.prev_screen()
+        self.add_message(f"Screen: {self.gui.current_screen.name}")
+
+    def _cmd_enter(self) -> None:
+        schedule = self.gui.handle_enter()
+        if schedule:
+            self.simulator.start_schedule(schedule)
+            self.add_message(f"Started: {escape(schedule.name)}")
+        # Check if builder has a schedule ready
+        if self.gui.current_screen == Screen.SCHEDULE_BUILDER:
+            built = self.gui.get_built_schedule()
+            if built:
+                self.simulator.start_schedule(built)
+                self.add_message(f"Started custom schedule")
+
+    def _cmd_stop_schedule(self) -> None:
+        self.simulator.stop_schedule()
+        self.add_message("Schedule stopped")
+
+    def _cmd_start_preset(self, schedule: Schedule) -> None:
+        self.simulator.start_schedule(schedule)
+        self.add_message(f"Started: {escape(schedule.name)}")
+
+    def _cmd_export(self) -> None:
+        if self.simulator.datalog:
+            filename = self.simulator.datalog.generate_filename("csv")
+            export_path = Path.home() / ".crockpot" / filename
+            self.simulator.datalog.to_csv(export_path)
+            self.add_message(f"[green]Exported to {escape(str(export_path))}[/]")
+        else:
+            self.add_message("[red]Datalog not enabled[/]")
 
-        elif cmd:
-            self.add_message(f"[red]Unknown: {cmd}[/]")
+    def handle_command(self, cmd: str) -> bool:
+        """
+        Handle a user command.
+        Returns False if should quit.
+        """
+        cmd = cmd.strip().lower()
+        self._command_count += 1
+
+        if cmd in ("/quit", "/q", "q"):
+            return False
+
+        handler = self._command_table.get(cmd)
+        if handler:
+            handler()
+        else:
+            self.add_message(f"[red]Unknown: {escape(cmd)}[/]")
 
         return True
@@ -4,17 +4,45 @@ Provides REST API and simple web UI for control.
 """
 
 import asyncio
+import gzip
 import json
 import logging
+import time
+import zlib
 from typing import TYPE_CHECKING, Callable
 
 from aiohttp import web
 
+from crockpot_sim import CrockpotState
+
 if TYPE_CHECKING:
     from crockpot_sim import CrockpotSimulator
 
 logger = logging.getLogger(__name__)
 
+# Upper-case name -> state for POST /api/state/{state}
+STATES_BY_NAME: dict[str, CrockpotState] = {state.name: state for state in CrockpotState}
+
+# orjson is optional; fall back to the stdlib json module
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Response headers are built once; aiohttp copies them into each response
+JSON_HEADERS = {"Content-Type": "application/json"}
+EVENT_STREAM_HEADERS = {"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+
+
+def _json_response(data, status: int = 200) -> web.Response:
+    """JSON response with the body already encoded to bytes."""
+    return web.Response(body=_dumps(data), status=status, headers=JSON_HEADERS)
+
 # Simple HTML UI
 HTML_PAGE = """<!DOCTYPE html>
 <html>
@@ -116,44 +144,73 @@ HTML_PAGE = """<!DOCTYPE html>
     </div>
 
     <script>
-        async function fetchStatus() {
-            try {
-                const res = await fetch('/api/status');
-                const data = await res.json();
-
-                const stateEl = document.getElementById('state');
+        // Elements updated on every status message, looked up once
+        const stateEl = document.getElementById('state');
+        const tempEl = document.getElementById('temp');
+        const uptimeEl = document.getElementById('uptime');
+        const sensorEl = document.getElementById('sensor');
+        const scheduleContainer = document.getElementById('schedule-container');
+        const buttons = {};
+        document.querySelectorAll('.buttons button').forEach(btn => {
+            buttons[btn.textContent] = btn;
+        });
+        let activeBtn = null;
+        let scheduleHtml = '';
+        // en-US without grouping matches toFixed(1) output
+        const tempFmt = new Intl.NumberFormat('en-US', {
+            minimumFractionDigits: 1, maximumFractionDigits: 1, useGrouping: false
+        });
+        // Last rendered values; unchanged fields skip their DOM writes
+        const last = {state: '', temp: NaN, uptime: -1, sensorError: null};
+
+        function render(data) {
+            if (data.state !== last.state) {
                 stateEl.textContent = data.state;
                 stateEl.className = 'status-value state-' + data.state;
 
-                document.getElementById('temp').textContent = data.temperature_f.toFixed(1) + '°F';
+                // Update button active states
+                const btn = buttons[data.state] || null;
+                if (activeBtn) activeBtn.classList.remove('btn-active');
+                if (btn) btn.classList.add('btn-active');
+                activeBtn = btn;
+                last.state = data.state;
+            }
 
+            if (data.temperature_f !== last.temp) {
+                tempEl.textContent = tempFmt.format(data.temperature_f) + '°F';
+                last.temp = data.temperature_f;
+            }
+
+            if (data.uptime_seconds !== last.uptime) {
                 const mins = Math.floor(data.uptime_seconds / 60);
                 const secs = data.uptime_seconds % 60;
-                document.getElementById('uptime').textContent = mins + 'm ' + secs + 's';
+                uptimeEl.textContent = mins + 'm ' + secs + 's';
+                last.uptime = data.uptime_seconds;
+            }
 
-                const sensorEl = document.getElementById('sensor');
+            if (data.sensor_error !== last.sensorError) {
                 sensorEl.textContent = data.sensor_error ? 'ERROR' : 'OK';
                 sensorEl.className = 'status-value ' + (data.sensor_error ? 'error' : 'ok');
+                last.sensorError = data.sensor_error;
+            }
 
-                // Update button active states
-                document.querySelectorAll('.buttons button').forEach(btn => {
-                    btn.classList.remove('btn-active');
-                });
-                const activeBtn = document.querySelector('.btn-' + data.state.toLowerCase());
-                if (activeBtn) activeBtn.classList.add('btn-active');
-
-                // Schedule info
-                const scheduleContainer = document.getElementById('schedule-container');
-                if (data.schedule_active) {
-                    scheduleContainer.innerHTML = `
-                        <div class="schedule-info">
-                            <strong>Schedule:</strong> ${data.schedule_name}<br>
-                            Step ${data.schedule_step + 1}/${data.schedule_total_steps}
-                        </div>
-                    `;
-                } else {
-                    scheduleContainer.innerHTML = '';
-                }
+            // Schedule info
+            const html = data.schedule_active ? `
+                    <div class="schedule-info">
+                        <strong>Schedule:</strong> ${data.schedule_name}<br>
+                        Step ${data.schedule_step + 1}/${data.schedule_total_steps}
+                    </div>
+                ` : '';
+            if (html !== scheduleHtml) {
+                scheduleContainer.innerHTML = html;
+                scheduleHtml = html;
+            }
+        }
+
+        async function fetchStatus() {
+            try {
+                const res = await fetch('/api/status');
+                render(await res.json());
             } catch (e) {
                 console.error('Failed to fetch status:', e);
             }
@@ -168,13 +225,37 @@ HTML_PAGE = """<!DOCTYPE html>
             }
         }
 
-        // Poll for status updates
+        // Server pushes status when it changes; poll if EventSource is unavailable
         fetchStatus();
-        setInterval(fetchStatus, 1000);
+        if (window.EventSource) {
+            new EventSource('/api/events').onmessage = e => render(JSON.parse(e.data));
+        } else {
+            setInterval(fetchStatus, 1000);
+        }
     </script>
 </body>
 </html>
 """
+HTML_PAGE_BYTES = HTML_PAGE.encode("utf-8")
+HTML_PAGE_GZIP = gzip.compress(HTML_PAGE_BYTES, compresslevel=9, mtime=0)
+HTML_PAGE_ETAG = f'W/"{zlib.crc32(HTML_PAGE_BYTES):08x}"'
+HTML_PAGE_HEADERS = {
+    "Content-Type": "text/html; charset=utf-8",
+    "ETag": HTML_PAGE_ETAG,
+    "Vary": "Accept-Encoding",
+}
+HTML_PAGE_GZIP_HEADERS = {**HTML_PAGE_HEADERS, "Content-Encoding": "gzip"}
+
+# /api/help is static, so it is serialized once
+HELP_BODY = _dumps({
+    "endpoints": {
+        "GET /": "Web UI",
+        "GET /api/status": "Get current status",
+        "GET /api/events": "Status stream (Server-Sent Events)",
+        "POST /api/state/{off|warm|low|high}": "Set state",
+        "GET /api/help": "This help message",
+    }
+})
 
 
 class WebServer:
@@ -203,23 +284,36 @@ class WebServer:
         self.app = web.Application()
         self.runner: web.AppRunner | None = None
         self._running = False
+        # Replaced on every notify_status() so each waiter wakes exactly once
+        self._status_changed = asyncio.Event()
+        # Last encoded status, shared by /api/status polls and every /api/events stream
+        self._payload_key: tuple | None = None
+        self._payload: tuple[str, bytes] = ("", b"")
+        # ETags are "<server start>-<payload version>", so a restart never reuses one
+        self._payload_version = 0
+        self._etag_prefix = f"{time.time_ns():x}"
 
         # Set up routes
         self.app.router.add_get("/", self._handle_index)
         self.app.router.add_get("/api/status", self._handle_status)
+        self.app.router.add_get("/api/events", self._handle_events)
         self.app.router.add_post("/api/state/{state}", self._handle_set_state)
         self.app.router.add_get("/api/help", self._handle_help)
 
     async def _handle_index(self, request: web.Request) -> web.Response:
         """Serve the web UI."""
-        return web.Response(text=HTML_PAGE, content_type="text/html")
-
-    async def _handle_status(self, request: web.Request) -> web.Response:
-        """Return current status as JSON."""
-        status = self.simulator.get_status()
-        data = {
+        if request.headers.get("If-None-Match") == HTML_PAGE_ETAG:
+            return web.Response(status=304, headers=HTML_PAGE_HEADERS)
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return web.Response(body=HTML_PAGE_GZIP, headers=HTML_PAGE_GZIP_HEADERS)
+        return web.Response(body=HTML_PAGE_BYTES, headers=HTML_PAGE_HEADERS)
+
+    def _status_data(self, status) -> dict:
+        """JSON-ready dict for a CrockpotStatus."""
+        return {
             "state": status.state.name,
-            "temperature_f": status.temperature_f,
+            # Same 0.1F resolution as the page, the TUI and the Telegram bot
+            "temperature_f": round(status.temperature_f, 1),
             "uptime_seconds": status.uptime_seconds,
             "wifi_connected": status.wifi_connected,
             "sensor_error": status.sensor_error,
@@ -230,38 +324,91 @@ class WebServer:
             "schedule_step": status.schedule_step,
             "schedule_total_steps": status.schedule_total_steps,
         }
-        return web.json_response(data)
+
+    def _status_payload(self, status) -> tuple[str, bytes]:
+        """(weak ETag, JSON body) for a status, re-encoded only when a field changes."""
+        key = (
+            status.state,
+            round(status.temperature_f, 1),
+            status.uptime_seconds,
+            status.wifi_connected,
+            status.sensor_error,
+            status.relay_main,
+            status.relay_aux,
+            status.schedule_active,
+            status.schedule_name,
+            status.schedule_step,
+            status.schedule_total_steps,
+        )
+        if key != self._payload_key:
+            self._payload_key = key
+            self._payload_version += 1
+            self._payload = (
+                f'W/"{self._etag_prefix}-{self._payload_version}"',
+                _dumps(self._status_data(status)),
+            )
+        return self._payload
+
+    async def _handle_status(self, request: web.Request) -> web.Response:
+        """Return current status as JSON."""
+        etag, body = self._status_payload(self.simulator.get_status())
+        headers = {"Content-Type": "application/json", "ETag": etag, "Cache-Control": "no-cache"}
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers=headers)
+
+        return web.Response(body=body, headers=headers)
+
+    async def _handle_events(self, request: web.Request) -> web.StreamResponse:
+        """Stream status as Server-Sent Events, pushing only when it changes."""
+        response = web.StreamResponse(headers=EVENT_STREAM_HEADERS)
+        await response.prepare(request)
+
+        last_body = None
+        while self._running:
+            transport = request.transport
+            if transport is None or transport.is_closing():
+                break
+            changed = self._status_changed
+            _, body = self._status_payload(self.simulator.get_status())
+            if body != last_body:
+                try:
+                    await response.write(b"data: " + body + b"\n\n")
+                except ConnectionResetError:
+                    # Browser tab closed
+                    break
+                last_body = body
+            await changed.wait()
+
+        return response
+
+    def notify_status(self) -> None:
+        """Wake /api/events streams; must be called on the server's event loop."""
+        self._status_changed.set()
+        self._status_changed = asyncio.Event()
 
     async def _handle_set_state(self, request: web.Request) -> web.Response:
         """Set crockpot state."""
         state_str = request.match_info["state"].upper()
-        state = self.simulator.state_from_string(state_str)
+        state = STATES_BY_NAME.get(state_str)
 
         if state is None:
-            return web.json_response(
+            return _json_response(
                 {"error": f"Invalid state: {state_str}"},
                 status=400
             )
 
         self.simulator.set_state(state)
+        self.notify_status()
         response = f"Crockpot set to {state.name}"
 
         if self.on_command:
             self.on_command(f"/api/state/{state_str.lower()}", response)
 
-        return web.json_response({"success": True, "state": state.name})
+        return _json_response({"success": True, "state": state.name})
 
     async def _handle_help(self, request: web.Request) -> web.Response:
         """Return API help."""
-        help_text = {
-            "endpoints": {
-                "GET /": "Web UI",
-                "GET /api/status": "Get current status",
-                "POST /api/state/{off|warm|low|high}": "Set state",
-                "GET /api/help": "This help message",
-            }
-        }
-        return web.json_response(help_text)
+        return web.Response(body=HELP_BODY, headers=JSON_HEADERS)
 
     async def start(self) -> None:
         """Start the web server."""
@@ -275,6 +422,7 @@ class WebServer:
     async def stop(self) -> None:
         """Stop the web server."""
         self._running = False
+        self.notify_status()
         if self.runner:
             await self.runner.cleanup()
             logger.info("Web server stopped")